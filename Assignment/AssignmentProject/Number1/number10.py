@@ -1,13 +1,66 @@
+"""
+User profile serialization and deserialization with error handling.
+
+orjson is an optional dependency: when it is installed it encodes and decodes
+documents that it represents exactly like the stdlib json module. Anything
+else falls back to json: NaN/Infinity, integers outside 64 bits, non-string
+keys and subclassed containers.
+"""
 import json
 import logging
+import math
+import os
+import re
+import sys
+import tempfile
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Compiled once at import so bulk profile construction doesn't pay for it
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Key order of UserProfile.to_dict(); '_version' is the schema version for compatibility
+_TO_DICT_KEYS = ('name', 'age', 'email', 'preferences', 'created_at', 'last_updated', '_version')
+_VERSION = sys.intern('1.0')
+
+# Fields UserProfile.from_dict() requires
+_REQUIRED = ('name', 'age', 'email')
+
+# Types accepted as-is by the JSON encoders (see _is_json); subclasses such as
+# IntEnum are accepted too, as json.dumps does
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Dict key types json.dumps accepts (it writes them as strings)
+_JSON_KEYS = (str, int, float, bool, type(None))
+
+# Limits of what orjson encodes (see _orjson_safe)
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_ORJSON_MAX_DEPTH = 254
+
+# Last formatted timestamp, keyed on a ~1ms monotonic tick
+_now_bucket = None
+_now_value = ''
+
+
+def _now_iso() -> str:
+    """Return datetime.now().isoformat(), reusing the formatted value within the same ~1ms tick."""
+    global _now_bucket, _now_value
+    bucket = time.monotonic_ns() >> 20
+    if bucket != _now_bucket:
+        _now_bucket = bucket
+        _now_value = datetime.now().isoformat()
+    return _now_value
+
 
 class SerializationError(Exception):
     """Custom exception for serialization errors."""
@@ -24,7 +77,10 @@ class UserProfile:
     Represents a user profile with validation and serialization capabilities.
     """
 
-    def __init__(self, name: str, age: int, email: str, preferences: Dict[str, Any] = None):
+    __slots__ = ('name', 'age', 'email', 'preferences', 'created_at', 'last_updated')
+
+    def __init__(self, name: str, age: int, email: str, preferences: Dict[str, Any] = None,
+                 created_at: Optional[str] = None, last_updated: Optional[str] = None):
         """
         Initialize a user profile with validation.
 
@@ -33,39 +89,44 @@ class UserProfile:
             age (int): User's age (must be between 0 and 150)
             email (str): User's email address
             preferences (Dict): User preferences dictionary
+            created_at (str, optional): Creation timestamp to restore (defaults to now)
+            last_updated (str, optional): Last update timestamp to restore (defaults to now)
         """
-        self._validate_name(name)
-        self._validate_age(age)
-        self._validate_email(email)
+        self._validate_all(name, age, email)
 
         self.name = name
         self.age = age
         self.email = email
         self.preferences = preferences or {}
-        self.created_at = datetime.now().isoformat()
-        self.last_updated = self.created_at
+        if created_at is None or last_updated is None:
+            now = _now_iso()
+            created_at = now if created_at is None else created_at
+            last_updated = now if last_updated is None else last_updated
+        self.created_at = created_at
+        self.last_updated = last_updated
+
+    @staticmethod
+    def _validate_all(name: str, age: int, email: str) -> None:
+        """
+        Validate name, age and email in one call.
 
-    def _validate_name(self, name: str) -> None:
-        """Validate the name field."""
-        if not isinstance(name, str):
+        The name, age and email checks are kept in this one function so that
+        construction doesn't pay for three method dispatches.
+        """
+        if type(name) is not str:
             raise ValueError("Name must be a string")
-        if not name.strip():
+        # isspace() stops at the first non-space character and doesn't copy like strip()
+        if not name or name.isspace():
             raise ValueError("Name cannot be empty")
         if len(name) > 100:
             raise ValueError("Name too long (max 100 characters)")
-
-    def _validate_age(self, age: int) -> None:
-        """Validate the age field."""
         if not isinstance(age, int):
             raise ValueError("Age must be an integer")
         if age < 0 or age > 150:
             raise ValueError("Age must be between 0 and 150")
-
-    def _validate_email(self, email: str) -> None:
-        """Basic email validation."""
         if not isinstance(email, str):
             raise ValueError("Email must be a string")
-        if "@" not in email or "." not in email:
+        if not _EMAIL_RE.fullmatch(email):
             raise ValueError("Invalid email format")
 
     def update_preferences(self, new_preferences: Dict[str, Any]) -> None:
@@ -79,32 +140,27 @@ class UserProfile:
                 raise ValueError("Preference keys must be strings")
             # Ensure value is JSON serializable
             try:
-                json.dumps(value)
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Preference value for '{key}' is not JSON serializable: {e}")
+                serializable = _is_json(value)
+            except ValueError as e:
+                raise ValueError(f"Preference value for '{key}' is not JSON serializable: {e}") from None
+            if not serializable:
+                raise ValueError(f"Preference value for '{key}' is not JSON serializable: "
+                                 f"type {type(value).__name__} is not JSON serializable")
 
         self.preferences.update(new_preferences)
-        self.last_updated = datetime.now().isoformat()
+        self.last_updated = _now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert user profile to dictionary for serialization."""
-        return {
-            'name': self.name,
-            'age': self.age,
-            'email': self.email,
-            'preferences': self.preferences,
-            'created_at': self.created_at,
-            'last_updated': self.last_updated,
-            '_version': '1.0'  # Schema version for compatibility
-        }
+        return dict(zip(_TO_DICT_KEYS, (self.name, self.age, self.email, self.preferences,
+                                        self.created_at, self.last_updated, _VERSION)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserProfile':
         """Create UserProfile from dictionary with validation."""
         try:
             # Check required fields
-            required_fields = ['name', 'age', 'email']
-            for field in required_fields:
+            for field in _REQUIRED:
                 if field not in data:
                     raise DeserializationError(f"Missing required field: {field}")
 
@@ -113,15 +169,12 @@ class UserProfile:
                 name=data['name'],
                 age=data['age'],
                 email=data['email'],
-                preferences=data.get('preferences', {})
+                preferences=data.get('preferences', {}),
+                # Restore metadata if available
+                created_at=data.get('created_at'),
+                last_updated=data.get('last_updated')
             )
 
-            # Restore metadata if available
-            if 'created_at' in data:
-                profile.created_at = data['created_at']
-            if 'last_updated' in data:
-                profile.last_updated = data['last_updated']
-
             return profile
 
         except (ValueError, TypeError) as e:
@@ -134,13 +187,15 @@ class UserProfile:
         return f"UserProfile(name='{self.name}', age={self.age}, email='{self.email}', preferences={self.preferences})"
 
 
-def serialize_user_profile(profile: UserProfile, filename: Optional[str] = None) -> str:
+def serialize_user_profile(profile: UserProfile, filename: Optional[str] = None,
+                           validate: bool = False) -> str:
     """
     Serialize a UserProfile object to JSON format with comprehensive error handling.
 
     Args:
         profile (UserProfile): The user profile object to serialize
         filename (str, optional): If provided, save to file
+        validate (bool): Parse the output back and run an integrity check (off by default)
 
     Returns:
         str: JSON string representation of the profile
@@ -150,33 +205,35 @@ def serialize_user_profile(profile: UserProfile, filename: Optional[str] = None)
     """
     try:
         # Step 1: Convert to dictionary
-        logger.info(f"Starting serialization for user: {profile.name}")
+        logger.info("Starting serialization for user: %s", profile.name)
         profile_dict = profile.to_dict()
 
         # Step 2: Serialize to JSON with additional validation
-        json_data = json.dumps(profile_dict, indent=2, ensure_ascii=False, default=_json_serializer)
+        json_bytes = _dumps(profile_dict, indent=True)
 
-        # Step 3: Validate the JSON can be parsed back (round-trip validation)
-        try:
-            parsed_back = json.loads(json_data)
-            if parsed_back['name'] != profile.name:  # Basic integrity check
-                raise SerializationError("Data integrity check failed during serialization")
-        except (KeyError, json.JSONDecodeError) as e:
-            raise SerializationError(f"Serialization integrity check failed: {e}")
+        # Step 3: Optionally validate the JSON can be parsed back (round-trip validation)
+        if validate:
+            try:
+                parsed_back = _loads(json_bytes)
+                if parsed_back['name'] != profile.name:  # Basic integrity check
+                    raise SerializationError("Data integrity check failed during serialization")
+            except (KeyError, json.JSONDecodeError) as e:
+                raise SerializationError(f"Serialization integrity check failed: {e}")
 
         # Step 4: Save to file if filename provided
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(json_data)
-                logger.info(f"Profile successfully saved to: {filename}")
-            except IOError as e:
-                raise SerializationError(f"Failed to write to file '{filename}': {e}")
+                # Write the already-encoded UTF-8 bytes in one call
+                with open(filename, 'wb') as f:
+                    f.write(json_bytes)
+                logger.info("Profile successfully saved to: %s", filename)
             except PermissionError as e:
                 raise SerializationError(f"Permission denied writing to file '{filename}': {e}")
+            except OSError as e:
+                raise SerializationError(f"Failed to write to file '{filename}': {e}")
 
-        logger.info(f"Successfully serialized profile for: {profile.name}")
-        return json_data
+        logger.info("Successfully serialized profile for: %s", profile.name)
+        return json_bytes.decode('utf-8')
 
     except (TypeError, ValueError) as e:
         error_msg = f"Data type error during serialization: {e}"
@@ -188,18 +245,14 @@ def serialize_user_profile(profile: UserProfile, filename: Optional[str] = None)
         logger.error(error_msg)
         raise SerializationError(error_msg)
 
-    except Exception as e:
-        error_msg = f"Unexpected error during serialization: {e}"
-        logger.error(error_msg)
-        raise SerializationError(error_msg)
 
-
-def deserialize_user_profile(json_data: str, filename: Optional[str] = None) -> UserProfile:
+def deserialize_user_profile(json_data: Optional[Union[str, bytes]] = None,
+                             filename: Optional[str] = None) -> UserProfile:
     """
     Deserialize JSON data back into a UserProfile object with comprehensive error handling.
 
     Args:
-        json_data (str): JSON string to deserialize (optional if filename provided)
+        json_data (str | bytes): JSON document to deserialize (optional if filename provided)
         filename (str, optional): File to read JSON data from
 
     Returns:
@@ -212,22 +265,23 @@ def deserialize_user_profile(json_data: str, filename: Optional[str] = None) ->
         # Step 1: Get JSON data from file or direct input
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
+                # Read raw bytes; the decoder accepts UTF-8 directly
+                with open(filename, 'rb') as f:
                     json_data = f.read()
-                logger.info(f"Successfully read data from: {filename}")
+                logger.info("Successfully read data from: %s", filename)
             except FileNotFoundError:
                 raise DeserializationError(f"File not found: {filename}")
-            except IOError as e:
-                raise DeserializationError(f"Error reading file '{filename}': {e}")
             except PermissionError as e:
                 raise DeserializationError(f"Permission denied reading file '{filename}': {e}")
+            except OSError as e:
+                raise DeserializationError(f"Error reading file '{filename}': {e}")
 
         if not json_data:
             raise DeserializationError("No JSON data provided for deserialization")
 
         # Step 2: Parse JSON with schema validation
         try:
-            parsed_data = json.loads(json_data)
+            parsed_data = _loads(json_data)
         except json.JSONDecodeError as e:
             raise DeserializationError(f"Invalid JSON format: {e}")
 
@@ -236,14 +290,14 @@ def deserialize_user_profile(json_data: str, filename: Optional[str] = None) ->
             raise DeserializationError("JSON data must represent a dictionary")
 
         # Step 4: Check schema version for compatibility
-        version = parsed_data.get('_version', '1.0')
-        if version != '1.0':
-            logger.warning(f"Loading data with different schema version: {version}")
+        version = parsed_data.get('_version', _VERSION)
+        if version != _VERSION:
+            logger.warning("Loading data with different schema version: %s", version)
 
         # Step 5: Create UserProfile from dictionary
         profile = UserProfile.from_dict(parsed_data)
 
-        logger.info(f"Successfully deserialized profile for: {profile.name}")
+        logger.info("Successfully deserialized profile for: %s", profile.name)
         return profile
 
     except KeyError as e:
@@ -251,16 +305,92 @@ def deserialize_user_profile(json_data: str, filename: Optional[str] = None) ->
         logger.error(error_msg)
         raise DeserializationError(error_msg)
 
-    except ValueError as e:
+    except (TypeError, ValueError) as e:
         error_msg = f"Data validation error during deserialization: {e}"
         logger.error(error_msg)
         raise DeserializationError(error_msg)
 
-    except Exception as e:
-        error_msg = f"Unexpected error during deserialization: {e}"
+
+def serialize_user_profiles(profiles: List[UserProfile], filename: str) -> int:
+    """
+    Serialize many UserProfile objects into a single JSON array file.
+
+    The array is written to a temporary file next to filename, which then
+    replaces filename, so a failure part-way through never leaves a
+    truncated file behind.
+
+    Args:
+        profiles (List[UserProfile]): The user profiles to serialize
+        filename (str): File to write the JSON array to
+
+    Returns:
+        int: Number of profiles written
+
+    Raises:
+        SerializationError: If a profile cannot be encoded or the file cannot be written
+    """
+    count = 0
+    temp_name = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(temp_name, 'wb', buffering=1 << 20) as f:
+            f.write(b'[')
+            for profile in profiles:
+                if count:
+                    f.write(b',')
+                f.write(_dumps(profile.to_dict()))
+                count += 1
+            f.write(b']')
+        os.replace(temp_name, filename)
+    except (TypeError, ValueError, AttributeError) as e:
+        error_msg = f"Failed to serialize profile #{count + 1}: {e}"
+        logger.error(error_msg)
+        raise SerializationError(error_msg)
+    except OSError as e:
+        error_msg = f"Failed to write to file '{filename}': {e}"
+        logger.error(error_msg)
+        raise SerializationError(error_msg)
+    finally:
+        # Only left behind if something above failed
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+
+    logger.info("Serialized %d profiles to: %s", count, filename)
+    return count
+
+
+def deserialize_user_profiles(filename: str) -> List[UserProfile]:
+    """
+    Deserialize a JSON array file written by serialize_user_profiles.
+
+    Args:
+        filename (str): File to read the JSON array from
+
+    Returns:
+        List[UserProfile]: Reconstructed UserProfile objects, in file order
+
+    Raises:
+        DeserializationError: If the file cannot be read or holds invalid profile data
+    """
+    try:
+        with open(filename, 'rb') as f:
+            parsed_data = _loads(f.read())
+    except OSError as e:
+        error_msg = f"Error reading file '{filename}': {e}"
+        logger.error(error_msg)
+        raise DeserializationError(error_msg)
+    except ValueError as e:
+        # JSONDecodeError, or UnicodeDecodeError for bytes that aren't UTF-8
+        error_msg = f"Invalid JSON format: {e}"
         logger.error(error_msg)
         raise DeserializationError(error_msg)
 
+    if not isinstance(parsed_data, list) or not all(isinstance(item, dict) for item in parsed_data):
+        raise DeserializationError("JSON data must represent a list of dictionaries")
+
+    profiles = [UserProfile.from_dict(item) for item in parsed_data]
+    logger.info("Deserialized %d profiles from: %s", len(profiles), filename)
+    return profiles
+
 
 def _json_serializer(obj: Any) -> Any:
     """
@@ -277,12 +407,132 @@ def _json_serializer(obj: Any) -> Any:
     """
     if isinstance(obj, (datetime,)):
         return obj.isoformat()
+    elif hasattr(obj, 'to_dict'):
+        return obj.to_dict()
     elif hasattr(obj, '__dict__'):
         return obj.__dict__
     else:
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def _is_json(value: Any, _active: Optional[set] = None) -> bool:
+    """
+    Check that a value is built only from JSON-native types, without encoding it.
+
+    Args:
+        value: Value to check
+        _active: ids of the containers enclosing value (used while recursing)
+
+    Returns:
+        bool: True if the value can be written as JSON as-is
+
+    Raises:
+        ValueError: If a container contains itself, as json.dumps would report
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    is_dict = isinstance(value, dict)
+    if not is_dict and not isinstance(value, (list, tuple)):
+        return False
+
+    if _active is None:
+        _active = set()
+    marker = id(value)
+    if marker in _active:
+        raise ValueError("Circular reference detected")
+    _active.add(marker)
+    if is_dict:
+        result = all(isinstance(k, _JSON_KEYS) and _is_json(v, _active) for k, v in value.items())
+    else:
+        result = all(_is_json(item, _active) for item in value)
+    _active.discard(marker)
+    return result
+
+
+# Reused stdlib encoders/decoder for when orjson isn't installed; json.dumps/loads
+# would otherwise build a new JSONEncoder/JSONDecoder on every call with these options
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_serializer)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=_json_serializer)
+_DECODER = json.JSONDecoder()
+
+
+def _orjson_safe(value: Any, depth: int = 0) -> bool:
+    """
+    Check that orjson encodes a value exactly as the stdlib encoder would.
+
+    orjson writes NaN and Infinity as null and rejects integers wider than
+    64 bits, so only plain JSON types within those limits qualify.
+
+    Args:
+        value: Value to check
+        depth (int): Nesting depth of value (used while recursing)
+
+    Returns:
+        bool: True if orjson can encode the value without loss
+    """
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is int:
+        return _INT64_MIN <= value <= _INT64_MAX
+    if value_type is float:
+        return math.isfinite(value)
+    # Past orjson's nesting limit (or on a cycle), let the stdlib report the error
+    if depth >= _ORJSON_MAX_DEPTH:
+        return False
+    if value_type is dict:
+        return all(type(k) is str and _orjson_safe(v, depth + 1) for k, v in value.items())
+    if value_type is list or value_type is tuple:
+        return all(_orjson_safe(item, depth + 1) for item in value)
+    return False
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode an object to UTF-8 JSON bytes, using orjson when it is installed
+    and can encode the object without loss.
+
+    Args:
+        obj: Object to encode
+        indent (bool): Pretty-print with two-space indentation
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None and _orjson_safe(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    encoder = _ENCODER if indent else _COMPACT_ENCODER
+    return encoder.encode(obj).encode('utf-8')
+
+
+def _loads(data: Any) -> Any:
+    """Decode a JSON document from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN and Infinity are only understood by the stdlib decoder
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return _DECODER.decode(data)
+
+
+def _safe_int(value: Any, default: int = 0) -> int:
+    """Coerce a recovered age to an int in the valid range, or return the default."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return value if 0 <= value <= 150 else default
+
+
+def _safe_str(value: Any, default: str) -> str:
+    """Coerce a recovered field to a non-empty string, or return the default."""
+    if isinstance(value, str):
+        return value or default
+    return str(value) if value else default
+
+
 def backup_deserialization_attempt(json_data: str) -> Optional[UserProfile]:
     """
     Attempt a backup deserialization with relaxed rules for corrupted data recovery.
@@ -297,7 +547,7 @@ def backup_deserialization_attempt(json_data: str) -> Optional[UserProfile]:
         logger.warning("Attempting backup deserialization for corrupted data")
 
         # Try to parse with relaxed error handling
-        parsed_data = json.loads(json_data)
+        parsed_data = _loads(json_data)
 
         # Extract fields with fallbacks
         name = parsed_data.get('name', 'Unknown User')
@@ -307,17 +557,17 @@ def backup_deserialization_attempt(json_data: str) -> Optional[UserProfile]:
 
         # Create basic profile (bypassing some validations)
         profile = UserProfile(
-            name=str(name) if name else 'Unknown User',
-            age=int(age) if isinstance(age, (int, float, str)) and str(age).isdigit() else 0,
-            email=str(email) if email else 'unknown@example.com',
+            name=_safe_str(name, 'Unknown User'),
+            age=_safe_int(age),
+            email=_safe_str(email, 'unknown@example.com'),
             preferences=preferences if isinstance(preferences, dict) else {}
         )
 
-        logger.info(f"Backup deserialization successful for: {profile.name}")
+        logger.info("Backup deserialization successful for: %s", profile.name)
         return profile
 
     except Exception as e:
-        logger.error(f"Backup deserialization failed: {e}")
+        logger.error("Backup deserialization failed: %s", e)
         return None
 
 
@@ -339,20 +589,33 @@ def demonstrate_serialization_deserialization():
     print("\n1. SUCCESSFUL SERIALIZATION AND DESERIALIZATION")
     print("-" * 50)
 
-    for i, user in enumerate(users, 1):
-        try:
-            print(f"\nProcessing user {i}: {user.name}")
+    # Keep the demo's files in a temporary directory (tmpfs on most systems)
+    with tempfile.TemporaryDirectory(prefix="user_profiles_") as output_dir:
+        print(f"Writing profile files to: {output_dir}")
+
+        for i, user in enumerate(users, 1):
+            try:
+                print(f"\nProcessing user {i}: {user.name}")
 
-            # Serialize
-            json_output = serialize_user_profile(user, f"user_profile_{i}.json")
-            print(f"✅ Serialization successful")
-            print(f"   JSON preview: {json_output[:100]}...")
+                # Serialize
+                json_output = serialize_user_profile(user, os.path.join(output_dir, f"user_profile_{i}.json"))
+                print(f"✅ Serialization successful")
+                print(f"   JSON preview: {json_output[:100]}...")
 
-            # Deserialize
-            restored_user = deserialize_user_profile(filename=f"user_profile_{i}.json")
-            print(f"✅ Deserialization successful")
-            print(f"   Restored: {restored_user}")
+                # Deserialize
+                restored_user = deserialize_user_profile(filename=os.path.join(output_dir, f"user_profile_{i}.json"))
+                print(f"✅ Deserialization successful")
+                print(f"   Restored: {restored_user}")
 
+            except (SerializationError, DeserializationError) as e:
+                print(f"❌ Error: {e}")
+
+        print("\nBatch round-trip of all users through a single file")
+        try:
+            batch_file = os.path.join(output_dir, "user_profiles.json")
+            count = serialize_user_profiles(users, batch_file)
+            restored_users = deserialize_user_profiles(batch_file)
+            print(f"✅ Wrote and restored {count} profiles: {[u.name for u in restored_users]}")
         except (SerializationError, DeserializationError) as e:
             print(f"❌ Error: {e}")
 
@@ -486,6 +749,9 @@ def explain_error_handling_mechanisms():
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     # Run the demonstration
     demonstrate_serialization_deserialization()
 
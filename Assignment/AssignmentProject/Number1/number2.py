@@ -1,4 +1,41 @@
-def suggest_activity(precipitation, temperature, wind_speed):
+from functools import lru_cache
+
+_MUSEUM = "Recommendation: Visit a museum or art gallery - perfect for a cold, rainy day!"
+_INDOOR_POOL = "Recommendation: Go to an indoor swimming pool or shopping mall - rainy but not too cold!"
+
+# Activity recommendations indexed by (is_raining << 2 | is_windy << 1 | is_cold).
+# Rain takes priority over wind, so the rainy entries ignore the windy bit.
+_RECOMMENDATIONS = (
+    # Perfect weather conditions - no rain, not cold, not windy
+    "Recommendation: Perfect for a picnic in the park or outdoor sports - enjoy the great weather!",
+    # Cold but not rainy or windy - suitable for certain outdoor activities
+    "Recommendation: Go for a brisk hike - cold weather is great for energetic outdoor exercise!",
+    # Windy but not rainy - consider temperature for outdoor activities
+    "Recommendation: Go flying a kite at the park - windy conditions are perfect for kite flying!",
+    "Recommendation: Try indoor rock climbing - too windy and cold for most outdoor activities!",
+    # Rainy conditions - recommend indoor activities
+    _INDOOR_POOL,
+    _MUSEUM,
+    _INDOOR_POOL,
+    _MUSEUM,
+)
+
+# Condition report printed by suggest_activity when verbose
+_CONDITIONS_REPORT = ("Weather Conditions: Precipitation={}mm/h, Temperature={}°C, Wind Speed={}km/h\n"
+                      "Status: Raining={}, Cold={}, Windy={}").format
+
+
+@lru_cache(maxsize=8)
+def _suggest_cached(is_raining, is_windy, is_cold):
+    """
+    Looks up the recommendation for a combination of weather conditions.
+
+    The state space is only 8 combinations, so every result stays cached.
+    """
+    return _RECOMMENDATIONS[is_raining << 2 | is_windy << 1 | is_cold]
+
+
+def suggest_activity(precipitation, temperature, wind_speed, *, verbose=False):
     """
     Recommends activities based on current weather conditions.
 
@@ -6,6 +43,7 @@ def suggest_activity(precipitation, temperature, wind_speed):
         precipitation (float): Precipitation in mm/h
         temperature (float): Temperature in Celsius
         wind_speed (float): Wind speed in km/h
+        verbose (bool): Print the weather conditions before recommending
 
     Returns:
         str: Recommended activity
@@ -16,32 +54,11 @@ def suggest_activity(precipitation, temperature, wind_speed):
     is_cold = temperature < 15  # True if temperature below 15°C (considered cold)
     is_windy = wind_speed > 20  # True if wind speed exceeds 20 km/h
 
-    print(f"Weather Conditions: Precipitation={precipitation}mm/h, "
-          f"Temperature={temperature}°C, Wind Speed={wind_speed}km/h")
-    print(f"Status: Raining={is_raining}, Cold={is_cold}, Windy={is_windy}")
-
-    # Decision-making logic for activity recommendations
-    if is_raining:
-        # Rainy conditions - recommend indoor activities
-        if is_cold:
-            return "Recommendation: Visit a museum or art gallery - perfect for a cold, rainy day!"
-        else:
-            return "Recommendation: Go to an indoor swimming pool or shopping mall - rainy but not too cold!"
-
-    elif is_windy:
-        # Windy but not rainy - consider temperature for outdoor activities
-        if is_cold:
-            return "Recommendation: Try indoor rock climbing - too windy and cold for most outdoor activities!"
-        else:
-            return "Recommendation: Go flying a kite at the park - windy conditions are perfect for kite flying!"
-
-    elif is_cold:
-        # Cold but not rainy or windy - suitable for certain outdoor activities
-        return "Recommendation: Go for a brisk hike - cold weather is great for energetic outdoor exercise!"
+    if verbose:
+        print(_CONDITIONS_REPORT(precipitation, temperature, wind_speed, is_raining, is_cold, is_windy))
 
-    else:
-        # Perfect weather conditions - no rain, not cold, not windy
-        return "Recommendation: Perfect for a picnic in the park or outdoor sports - enjoy the great weather!"
+    # Decision-making logic: look up the recommendation for the three conditions
+    return _suggest_cached(is_raining, is_windy, is_cold)
 
 
 def demonstrate_activity_suggestions():
@@ -51,32 +68,32 @@ def demonstrate_activity_suggestions():
 
     # Test Case 1: Perfect weather
     print("Test 1 - Perfect Weather:")
-    print(suggest_activity(0, 25, 10))  # No rain, warm, light breeze
+    print(suggest_activity(0, 25, 10, verbose=True))  # No rain, warm, light breeze
     print("\n" + "-" * 50 + "\n")
 
     # Test Case 2: Rainy and cold
     print("Test 2 - Rainy and Cold:")
-    print(suggest_activity(5, 10, 15))  # Rainy, cold, moderate wind
+    print(suggest_activity(5, 10, 15, verbose=True))  # Rainy, cold, moderate wind
     print("\n" + "-" * 50 + "\n")
 
     # Test Case 3: Windy but warm
     print("Test 3 - Windy but Warm:")
-    print(suggest_activity(0, 22, 25))  # No rain, warm, windy
+    print(suggest_activity(0, 22, 25, verbose=True))  # No rain, warm, windy
     print("\n" + "-" * 50 + "\n")
 
     # Test Case 4: Cold but dry
     print("Test 4 - Cold but Dry:")
-    print(suggest_activity(0, 12, 15))  # No rain, cold, light wind
+    print(suggest_activity(0, 12, 15, verbose=True))  # No rain, cold, light wind
     print("\n" + "-" * 50 + "\n")
 
     # Test Case 5: Light rain but warm
     print("Test 5 - Light Rain but Warm:")
-    print(suggest_activity(2, 20, 10))  # Light rain, warm, light wind
+    print(suggest_activity(2, 20, 10, verbose=True))  # Light rain, warm, light wind
     print("\n" + "-" * 50 + "\n")
 
     # Test Case 6: Very windy and cold
     print("Test 6 - Very Windy and Cold:")
-    print(suggest_activity(0, 8, 30))  # No rain, very cold, very windy
+    print(suggest_activity(0, 8, 30, verbose=True))  # No rain, very cold, very windy
 
 
 # Additional utility function for interactive testing
@@ -89,7 +106,7 @@ def interactive_weather_check():
         wind = float(input("Enter wind speed (km/h): "))
 
         print("\n" + "=" * 50)
-        print(suggest_activity(precip, temp, wind))
+        print(suggest_activity(precip, temp, wind, verbose=True))
         print("=" * 50)
 
     except ValueError:
@@ -1,6 +1,54 @@
+import sys
+from array import array
+from operator import index as _as_int
+
+
+# Case normalization used for inventory keys (unbound method hoisted once)
+_norm = str.casefold
+
+
+def _norm_key(title, author):
+    """Return the case-insensitive inventory key for a title and author."""
+    return (_norm(title), _norm(author))
+
+
+# Range of the stock column's array('q') items (C 64-bit signed integers)
+_STOCK_MIN = -2 ** 63
+_STOCK_MAX = 2 ** 63 - 1
+
+
+def _as_stock(quantity):
+    """
+    Return a stock quantity as an int for the stock column.
+
+    Integer-like values and whole-number floats are accepted.
+
+    Raises:
+        ValueError: If the quantity is not a whole number or does not fit
+                    in the stock column
+    """
+    try:
+        stock = _as_int(quantity)
+    except TypeError:
+        if not (isinstance(quantity, float) and quantity.is_integer()):
+            raise ValueError("Error: Stock quantity must be a whole number.") from None
+        stock = int(quantity)
+    if not _STOCK_MIN <= stock <= _STOCK_MAX:
+        raise ValueError("Error: Stock quantity is out of range.")
+    return stock
+
+
+# Formats one inventory row: _ROW_FMT((title, author, price, stock_quantity)).
+# %-formatting renders all four fields in a single C-level call.
+_ROW_FMT = "Title: %-20s | Author: %-15s | Price: $%6.2f | Stock: %3d".__mod__
+
+
 class Book:
     """
-    A class to represent a book in the inventory system.
+    A view of one book stored in a BookstoreInventory.
+
+    The inventory keeps each field in its own column; a Book reads and writes
+    its row of those columns.
 
     Attributes:
         title (str): The title of the book
@@ -9,20 +57,38 @@ class Book:
         stock_quantity (int): The number of copies in stock
     """
 
-    def __init__(self, title, author, price, stock_quantity):
+    __slots__ = ("_inventory", "_row")
+
+    def __init__(self, inventory, row):
         """
-        Initialize a new Book instance.
+        Initialize a view of a book in an inventory.
 
         Args:
-            title (str): Book title
-            author (str): Book author
-            price (float): Book price
-            stock_quantity (int): Initial stock quantity
+            inventory (BookstoreInventory): Inventory holding the book
+            row (int): Position of the book in the inventory's columns
         """
-        self.title = title
-        self.author = author
-        self.price = price
-        self.stock_quantity = stock_quantity
+        self._inventory = inventory
+        self._row = row
+
+    @property
+    def title(self):
+        """Title of the book."""
+        return self._inventory._titles[self._row]
+
+    @property
+    def author(self):
+        """Author of the book."""
+        return self._inventory._authors[self._row]
+
+    @property
+    def price(self):
+        """Price of the book."""
+        return self._inventory._prices[self._row]
+
+    @property
+    def stock_quantity(self):
+        """Number of copies in stock."""
+        return self._inventory._stock[self._row]
 
     def update_stock(self, new_quantity):
         """
@@ -31,24 +97,47 @@ class Book:
         Args:
             new_quantity (int): New stock quantity
         """
-        self.stock_quantity = new_quantity
+        self._inventory._stock[self._row] = _as_stock(new_quantity)
 
     def display_info(self):
         """Display the book's information in a formatted way."""
-        return f"Title: {self.title:<20} | Author: {self.author:<15} | Price: ${self.price:>6.2f} | Stock: {self.stock_quantity:>3}"
+        return _ROW_FMT((self.title, self.author, self.price, self.stock_quantity))
 
 
 class BookstoreInventory:
     """
     A class to manage the bookstore's inventory of books.
 
+    Books are stored column-wise: titles and authors in lists, prices and
+    stock quantities in typed arrays, all aligned by row in insertion order.
+
     Attributes:
-        books (list): List of Book objects in the inventory
+        books (list): Book views of the inventory, in insertion order
     """
 
+    # Fixed parts of the display_all_books listing
+    _HEADER = "=" * 80
+    _TITLE = "BOOKSTORE INVENTORY".center(80)
+    _COLS = f"{'Title':<20} | {'Author':<15} | {'Price':>8} | {'Stock':>5}"
+    _SEP = "-" * 80
+
     def __init__(self):
         """Initialize an empty inventory."""
-        self.books = []
+        self._titles = []
+        self._authors = []
+        self._prices = array('d')
+        self._stock = array('q')
+        # Case-insensitive (title, author) -> row index for O(1) lookups
+        self._index = {}
+
+    def __len__(self):
+        """Number of books in the inventory."""
+        return len(self._titles)
+
+    @property
+    def books(self):
+        """List of Book views, in insertion order."""
+        return [Book(self, row) for row in range(len(self))]
 
     def add_new_book(self, title, author, price, stock_quantity):
         """
@@ -63,25 +152,73 @@ class BookstoreInventory:
         Returns:
             str: Confirmation message
         """
-        # Input validation
-        if not title or not author:
-            return "Error: Title and author cannot be empty."
+        _, rejected = self.add_books([(title, author, price, stock_quantity)])
+        if rejected:
+            return rejected[0][1]
+        return f"Successfully added '{title}' by {author} to inventory."
 
-        if price < 0:
-            return "Error: Price cannot be negative."
+    def add_books(self, records):
+        """
+        Add many books to the inventory in a single pass.
 
-        if stock_quantity < 0:
-            return "Error: Stock quantity cannot be negative."
+        Args:
+            records (iterable): (title, author, price, stock_quantity) tuples
 
-        # Check if book already exists
-        for book in self.books:
-            if book.title.lower() == title.lower() and book.author.lower() == author.lower():
-                return f"Error: '{title}' by {author} already exists in inventory."
+        Returns:
+            tuple: (number of books added, list of (record, error message) pairs
+                   for the records that were rejected)
+        """
+        index = self._index
+        added = 0
+        rejected = []
 
-        # Create new book and add to inventory
-        new_book = Book(title, author, price, stock_quantity)
-        self.books.append(new_book)
-        return f"Successfully added '{title}' by {author} to inventory."
+        for record in records:
+            title, author, price, stock_quantity = record
+
+            # Input validation
+            if not title or not author:
+                rejected.append((record, "Error: Title and author cannot be empty."))
+                continue
+
+            # Coerce the numeric fields up front so a bad value is rejected
+            # before any column has been touched
+            try:
+                price = float(price)
+            except (TypeError, ValueError, OverflowError):
+                rejected.append((record, "Error: Price must be a number."))
+                continue
+
+            try:
+                stock_quantity = _as_stock(stock_quantity)
+            except ValueError as e:
+                rejected.append((record, str(e)))
+                continue
+
+            if price < 0:
+                rejected.append((record, "Error: Price cannot be negative."))
+                continue
+
+            if stock_quantity < 0:
+                rejected.append((record, "Error: Stock quantity cannot be negative."))
+                continue
+
+            # Check if book already exists (including earlier records in this batch)
+            key = _norm_key(title, author)
+            if key in index:
+                rejected.append((record, f"Error: '{title}' by {author} already exists in inventory."))
+                continue
+
+            # Add the new book as a row in each column, then index it; the stored
+            # key is interned since it is kept for every later lookup
+            row = len(self)
+            self._titles.append(title)
+            self._authors.append(author)
+            self._prices.append(price)
+            self._stock.append(stock_quantity)
+            index[(sys.intern(key[0]), sys.intern(key[1]))] = row
+            added += 1
+
+        return added, rejected
 
     def update_stock(self, title, author, new_quantity):
         """
@@ -96,16 +233,21 @@ class BookstoreInventory:
             str: Confirmation message
         """
         # Input validation
-        if new_quantity < 0:
+        try:
+            stock_quantity = _as_stock(new_quantity)
+        except ValueError as e:
+            return str(e)
+
+        if stock_quantity < 0:
             return "Error: Stock quantity cannot be negative."
 
         # Find the book and update its stock
-        for book in self.books:
-            if book.title.lower() == title.lower() and book.author.lower() == author.lower():
-                book.update_stock(new_quantity)
-                return f"Successfully updated stock for '{title}' by {author} to {new_quantity}."
+        row = self._index.get(_norm_key(title, author))
+        if row is None:
+            return f"Error: Book '{title}' by {author} not found in inventory."
 
-        return f"Error: Book '{title}' by {author} not found in inventory."
+        self._stock[row] = stock_quantity
+        return f"Successfully updated stock for '{title}' by {author} to {new_quantity}."
 
     def display_all_books(self):
         """
@@ -114,24 +256,16 @@ class BookstoreInventory:
         Returns:
             str: Formatted string with all books' information or empty message
         """
-        if not self.books:
+        if not len(self):
             return "No books in inventory."
 
-        # Create header and book list
-        header = "=" * 80
-        title_header = "BOOKSTORE INVENTORY"
-        column_header = f"{'Title':<20} | {'Author':<15} | {'Price':>8} | {'Stock':>5}"
-
-        result = [header, title_header.center(80), header, column_header, "-" * 80]
-
-        # Add each book's information
-        for book in self.books:
-            result.append(book.display_info())
+        # Format each book's information straight from the columns
+        rows = map(_ROW_FMT, zip(self._titles, self._authors, self._prices, self._stock))
 
-        result.append(header)
-        result.append(f"Total books in inventory: {len(self.books)}")
-
-        return "\n".join(result)
+        header = self._HEADER
+        return "\n".join([header, self._TITLE, header, self._COLS, self._SEP,
+                          *rows,
+                          header, f"Total books in inventory: {len(self)}"])
 
     def find_book(self, title, author):
         """
@@ -144,10 +278,8 @@ class BookstoreInventory:
         Returns:
             Book or None: Book object if found, None otherwise
         """
-        for book in self.books:
-            if book.title.lower() == title.lower() and book.author.lower() == author.lower():
-                return book
-        return None
+        row = self._index.get(_norm_key(title, author))
+        return None if row is None else Book(self, row)
 
 
 def main():
@@ -192,7 +324,14 @@ def main():
     print(bookstore.display_all_books())
 
 
-# Interactive menu for user input
+# Interactive menu for user input, written to stdout in one call
+_MENU = ("\n=== BOOKSTORE INVENTORY MENU ===\n"
+         "1. Add New Book\n"
+         "2. Update Stock Quantity\n"
+         "3. Display All Books\n"
+         "4. Exit\n")
+
+
 def interactive_menu():
     """
     Provides an interactive menu for the bookstore staff to use the system.
@@ -200,11 +339,7 @@ def interactive_menu():
     bookstore = BookstoreInventory()
 
     while True:
-        print("\n=== BOOKSTORE INVENTORY MENU ===")
-        print("1. Add New Book")
-        print("2. Update Stock Quantity")
-        print("3. Display All Books")
-        print("4. Exit")
+        sys.stdout.write(_MENU)
 
         choice = input("\nEnter your choice (1-4): ").strip()
 
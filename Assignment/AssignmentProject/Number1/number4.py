@@ -54,6 +54,13 @@ def demonstrate_lambda_usage():
     trading_volumes = [1000000, 500000, 750000, 1200000, 300000]
     portfolio_values = [5000, -2500, 10000, 7500, 0]
 
+    # Walk financial_records once into parallel columns; the sections below
+    # derive their views from these instead of re-scanning the records
+    tickers, prices, volumes, changes = map(list, zip(*(
+        (record.get('ticker'), record.get('price'), record.get('volume'), record.get('change'))
+        for record in financial_records
+    )))
+
     # =========================================================================
     # 1. USING LAMBDA FUNCTIONS DIRECTLY
     # =========================================================================
@@ -84,9 +91,8 @@ def demonstrate_lambda_usage():
     valid_portfolios = [value for value in portfolio_values if validate_positive_lambda(value)]
     print(f"Valid (positive) portfolios: {valid_portfolios}")
 
-    # Extract all tickers using list comprehension
-    all_tickers = [extract_field_lambda('ticker')(record) for record in financial_records]
-    print(f"All stock tickers: {all_tickers}")
+    # All tickers, taken from the single pass over the records
+    print(f"All stock tickers: {tickers}")
     print("\n" + "-" * 60 + "\n")
 
     # =========================================================================
@@ -106,8 +112,7 @@ def demonstrate_lambda_usage():
     formatted_prices = list(map(lambda price: f"${price:.2f}", stock_prices))
     print(f"Formatted prices: {formatted_prices}")
 
-    # Extract all volume data
-    volumes = list(map(extract_field_lambda('volume'), financial_records))
+    # All volume data, taken from the single pass over the records
     print(f"Trading volumes: {volumes}")
     print("\n" + "-" * 60 + "\n")
 
@@ -116,26 +121,17 @@ def demonstrate_lambda_usage():
     # =========================================================================
     print("4. LAMBDA FUNCTIONS WITH FILTER():")
 
-    # Filter stocks with positive price change
-    gainers = list(filter(
-        lambda record: validate_positive_lambda(record['change']),
-        financial_records
-    ))
-    print(f"Stocks with positive change: {[r['ticker'] for r in gainers]}")
+    # Filter stocks with positive price change (comparison inlined; no nested lambda call per record)
+    gainers = [ticker for ticker, change in zip(tickers, changes) if change > 0]
+    print(f"Stocks with positive change: {gainers}")
 
     # Filter high-volume stocks (volume > 700,000)
-    high_volume_stocks = list(filter(
-        lambda record: validate_positive_lambda(record['volume'] - 700000),
-        financial_records
-    ))
-    print(f"High volume stocks: {[r['ticker'] for r in high_volume_stocks]}")
+    high_volume_stocks = [ticker for ticker, volume in zip(tickers, volumes) if volume > 700000]
+    print(f"High volume stocks: {high_volume_stocks}")
 
     # Filter valid financial records (all required fields present)
-    required_fields = ['ticker', 'price', 'volume']
-    valid_records = list(filter(
-        lambda record: all(extract_field_lambda(field)(record) for field in required_fields),
-        financial_records
-    ))
+    required_fields = {'ticker', 'price', 'volume'}
+    valid_records = list(filter(lambda record: required_fields <= record.keys(), financial_records))
     print(f"Valid records count: {len(valid_records)}")
     print("\n" + "-" * 60 + "\n")
 
@@ -145,17 +141,13 @@ def demonstrate_lambda_usage():
     print("5. COMBINING MAP AND FILTER:")
 
     # Calculate price-to-volume ratio for high volume stocks only
-    high_volume_ratios = list(map(
-        lambda record: record['price'] / record['volume'],
-        filter(lambda record: record['volume'] > 600000, financial_records)
-    ))
+    # (filter the (price, volume) column pairs, then map each pair to its ratio)
+    high_volume_pairs = filter(lambda pair: pair[1] > 600000, zip(prices, volumes))
+    high_volume_ratios = list(map(lambda pair: pair[0] / pair[1], high_volume_pairs))
     print(f"Price/Volume ratios for high volume stocks: {[f'{r:.6f}' for r in high_volume_ratios]}")
 
     # Get percentage changes only for stocks with valid data
-    valid_changes = list(map(
-        extract_field_lambda('change'),
-        filter(lambda record: record.get('change') is not None, financial_records)
-    ))
+    valid_changes = [change for change in changes if change is not None]
     print(f"Valid price changes: {valid_changes}")
 
 
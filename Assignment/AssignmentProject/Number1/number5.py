@@ -1,3 +1,6 @@
+import sys
+
+
 def add_session(schedule, session_detail):
     """
     Adds a new study session to the schedule list.
@@ -29,18 +32,15 @@ def display_schedule(schedule, title="Current Study Schedule"):
         schedule (list): The list of study sessions
         title (str): The title for the display
     """
-    print(f"\n{title}")
-    print("=" * 50)
-
+    # Build the whole listing and write it to stdout in one call
+    buf = [f"\n{title}\n", "=" * 50 + "\n"]
     if not schedule:
-        print("No study sessions scheduled yet.")
-        return
-
-    for i, session in enumerate(schedule, 1):
-        print(f"{i}. {session}")
-
-    print(f"Total sessions: {len(schedule)}")
-    print("=" * 50)
+        buf.append("No study sessions scheduled yet.\n")
+    else:
+        buf.extend(f"{i}. {session}\n" for i, session in enumerate(schedule, 1))
+        buf.append(f"Total sessions: {len(schedule)}\n")
+        buf.append("=" * 50 + "\n")
+    sys.stdout.write("".join(buf))
 
 
 def demonstrate_basic_functionality():
@@ -62,9 +62,12 @@ def demonstrate_basic_functionality():
         "Chemistry - Organic Compounds Study"
     ]
 
+    # Confirm each addition with one line, then show the full schedule once
     for session in sessions_to_add:
         add_session(study_schedule, session)
-        display_schedule(study_schedule, f"After adding: '{session}'")
+        print(f"Added ({len(study_schedule)}): {session}")
+
+    display_schedule(study_schedule, "Final Schedule")
 
     return study_schedule
 
@@ -216,13 +219,10 @@ def performance_demonstration():
 
     print(f"\nAdding {num_sessions} study sessions dynamically...")
 
-    for i in range(1, num_sessions + 1):
-        session = f"Study Session #{i}: Topic Review and Practice"
-        add_session(large_schedule, session)
-
-        # Show progress for every 2 sessions
-        if i % 2 == 0:
-            print(f"Progress: {i}/{num_sessions} sessions added")
+    # Generated sessions are always non-empty strings, so append them all in one extend
+    large_schedule.extend(f"Study Session #{i}: Topic Review and Practice"
+                          for i in range(1, num_sessions + 1))
+    print(f"Progress: {len(large_schedule)}/{num_sessions} sessions added")
 
     print(f"\n✓ Successfully added {len(large_schedule)} sessions!")
     print(f"First 3 sessions: {large_schedule[:3]}")
@@ -257,6 +257,6 @@ if __name__ == "__main__":
     print("\nKey Features Demonstrated:")
     print("✓ Dynamic list expansion without overwriting existing data")
     print("✓ Sequential addition of study sessions")
-    print("✓ Real-time schedule display after each addition")
+    print("✓ Real-time confirmation after each addition")
     print("✓ Input validation and error handling")
     print("✓ Support for various session formats and types")
\ No newline at end of file
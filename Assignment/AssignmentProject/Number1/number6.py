@@ -1,4 +1,19 @@
-def update_metrics(marketing_data, channel, new_data):
+import functools
+
+
+# Sorted metric names per distinct metric set, reused across display_summary
+# calls; bounded so an unbounded variety of metric sets can't grow it forever
+@functools.lru_cache(maxsize=128)
+def _sorted_names(names):
+    """Return a frozenset of metric names as a sorted tuple."""
+    return tuple(sorted(names))
+
+
+# Metric value types that summarize_metrics adds to the totals
+_NUMERIC = (int, float)
+
+
+def update_metrics(marketing_data, channel, new_data, *, verbose=False, validate=True):
     """
     Updates metrics for a specific marketing channel by merging new data with existing metrics.
 
@@ -6,29 +21,38 @@ def update_metrics(marketing_data, channel, new_data):
         marketing_data (dict): The main dictionary containing all marketing channels data
         channel (str): The specific marketing channel to update
         new_data (dict): Dictionary containing metric updates (e.g., {'clicks': 50, 'impressions': 1000})
+        verbose (bool): Print a line for each created channel or changed metric
+        validate (bool): Check argument types; trusted callers can pass False
 
     Returns:
         dict: The updated marketing_data dictionary
     """
     # Input validation
-    if not isinstance(marketing_data, dict):
-        raise TypeError("marketing_data must be a dictionary")
+    if validate:
+        if not isinstance(marketing_data, dict):
+            raise TypeError("marketing_data must be a dictionary")
 
-    if not isinstance(new_data, dict):
-        raise TypeError("new_data must be a dictionary")
+        if not isinstance(new_data, dict):
+            raise TypeError("new_data must be a dictionary")
 
-    if not channel or not isinstance(channel, str):
-        raise ValueError("channel must be a non-empty string")
+        if not channel or not isinstance(channel, str):
+            raise ValueError("channel must be a non-empty string")
 
     # If channel doesn't exist, create it with the new_data
     if channel not in marketing_data:
         marketing_data[channel] = new_data.copy()
-        print(f"✓ Created new channel '{channel}' with data: {new_data}")
+        if verbose:
+            print(f"✓ Created new channel '{channel}' with data: {new_data}")
         return marketing_data
 
     # If channel exists, merge the new_data with existing metrics
     existing_metrics = marketing_data[channel]
 
+    if not verbose:
+        # Nothing to report, so merge in one call
+        existing_metrics.update(new_data)
+        return marketing_data
+
     for metric, value in new_data.items():
         if metric in existing_metrics:
             # Update existing metric (you can choose to replace or add)
@@ -42,28 +66,74 @@ def update_metrics(marketing_data, channel, new_data):
     return marketing_data
 
 
-def summarize_metrics(marketing_data):
+def update_metrics_many(marketing_data, updates, *, verbose=False, validate=True):
+    """
+    Applies a batch of channel updates with the same merge rules as update_metrics.
+
+    Every update is validated before any is applied, so a bad entry leaves
+    marketing_data untouched.
+
+    Args:
+        marketing_data (dict): The main dictionary containing all marketing channels data
+        updates (list): (channel, new_data) pairs to apply in order
+        verbose (bool): Print a line for each created channel or changed metric
+        validate (bool): Check argument types; trusted callers can pass False
+
+    Returns:
+        dict: The updated marketing_data dictionary
+    """
+    # Input validation
+    if validate:
+        if not isinstance(marketing_data, dict):
+            raise TypeError("marketing_data must be a dictionary")
+
+        updates = list(updates)
+        for channel, new_data in updates:
+            if not isinstance(new_data, dict):
+                raise TypeError("new_data must be a dictionary")
+
+            if not channel or not isinstance(channel, str):
+                raise ValueError("channel must be a non-empty string")
+
+    if verbose:
+        # Already validated above (or trusted), so skip the per-call checks
+        for channel, new_data in updates:
+            update_metrics(marketing_data, channel, new_data, verbose=True, validate=False)
+        return marketing_data
+
+    # Quiet path: create or merge each channel directly
+    for channel, new_data in updates:
+        existing_metrics = marketing_data.get(channel)
+        if existing_metrics is None:
+            marketing_data[channel] = new_data.copy()
+        else:
+            existing_metrics.update(new_data)
+
+    return marketing_data
+
+
+def summarize_metrics(marketing_data, *, validate=True):
     """
     Calculates total clicks and impressions across all marketing channels.
 
     Args:
         marketing_data (dict): The main dictionary containing all marketing channels data
+        validate (bool): Check the argument type; trusted callers can pass False
 
     Returns:
-        dict: A summary dictionary with total clicks, impressions, and other aggregated metrics
+        dict: A summary dictionary with total clicks, impressions, and other aggregated metrics;
+              '_extras' maps each non-core metric name to its total
     """
     # Input validation
-    if not isinstance(marketing_data, dict):
+    if validate and not isinstance(marketing_data, dict):
         raise TypeError("marketing_data must be a dictionary")
 
-    # Initialize summary dictionary
-    summary = {
-        'total_clicks': 0,
-        'total_impressions': 0,
-        'total_conversions': 0,
-        'channels_analyzed': 0,
-        'metrics_found': set()
-    }
+    # Per-metric running totals; the core metrics come first so they keep
+    # their place in the summary even when no channel reports them
+    totals = {'clicks': 0, 'impressions': 0, 'conversions': 0}
+    metrics_found = set()
+    channels_analyzed = 0
+    get_total = totals.get
 
     # Traverse through all channels and aggregate metrics
     for channel, metrics in marketing_data.items():
@@ -71,26 +141,27 @@ def summarize_metrics(marketing_data):
             print(f"⚠ Warning: Channel '{channel}' has invalid metrics format")
             continue
 
-        summary['channels_analyzed'] += 1
+        channels_analyzed += 1
+        metrics_found.update(metrics)
 
-        # Aggregate each metric
+        # Only sum numeric values
         for metric, value in metrics.items():
-            summary['metrics_found'].add(metric)
-
-            # Only sum numeric values
-            if isinstance(value, (int, float)):
-                if metric == 'clicks':
-                    summary['total_clicks'] += value
-                elif metric == 'impressions':
-                    summary['total_impressions'] += value
-                elif metric == 'conversions':
-                    summary['total_conversions'] += value
-                else:
-                    # For any other numeric metrics, create dynamic totals
-                    total_key = f'total_{metric}'
-                    if total_key not in summary:
-                        summary[total_key] = 0
-                    summary[total_key] += value
+            if isinstance(value, _NUMERIC):
+                totals[metric] = get_total(metric, 0) + value
+
+    # Build the summary; dynamic totals follow the core fields in first-seen order
+    summary = {
+        'total_clicks': totals.pop('clicks'),
+        'total_impressions': totals.pop('impressions'),
+        'total_conversions': totals.pop('conversions'),
+        'channels_analyzed': channels_analyzed,
+        'metrics_found': metrics_found
+    }
+    for metric, total in totals.items():
+        summary[f'total_{metric}'] = total
+    # After the pops, totals holds only the non-core metrics; keep it so
+    # display_summary doesn't have to rescan the summary keys for them
+    summary['_extras'] = totals
 
     # Calculate derived metrics
     if summary['total_impressions'] > 0:
@@ -114,19 +185,20 @@ def display_marketing_data(marketing_data, title="Marketing Analytics Data"):
         marketing_data (dict): The marketing data dictionary
         title (str): Display title
     """
-    print(f"\n{title}")
-    print("=" * 70)
+    # Collect every line first and print the listing in one call
+    lines = [f"\n{title}", "=" * 70]
 
     if not marketing_data:
-        print("No marketing data available.")
+        lines.append("No marketing data available.")
+        print("\n".join(lines))
         return
 
     for channel, metrics in marketing_data.items():
-        print(f"\n📊 {channel.upper()}:")
-        for metric, value in metrics.items():
-            print(f"   • {metric}: {value:,}")
+        lines.append(f"\n📊 {channel.upper()}:")
+        lines.extend(f"   • {metric}: {value:,}" for metric, value in metrics.items())
 
-    print("=" * 70)
+    lines.append("=" * 70)
+    print("\n".join(lines))
 
 
 def display_summary(summary):
@@ -136,8 +208,8 @@ def display_summary(summary):
     Args:
         summary (dict): The summary dictionary from summarize_metrics
     """
-    print(f"\n📈 MARKETING PERFORMANCE SUMMARY")
-    print("=" * 50)
+    # Collect every line first and print the summary in one call
+    lines = ["\n📈 MARKETING PERFORMANCE SUMMARY", "=" * 50]
 
     # Display core metrics
     core_metrics = ['total_clicks', 'total_impressions', 'total_conversions']
@@ -145,29 +217,31 @@ def display_summary(summary):
         if metric in summary:
             value = summary[metric]
             formatted_name = metric.replace('_', ' ').title()
-            print(f"{formatted_name}: {value:,}")
+            lines.append(f"{formatted_name}: {value:,}")
 
     # Display calculated metrics
-    print(f"\n📊 Performance Ratios:")
+    lines.append("\n📊 Performance Ratios:")
     if 'overall_ctr' in summary:
-        print(f"Click-Through Rate (CTR): {summary['overall_ctr']:.2f}%")
+        lines.append(f"Click-Through Rate (CTR): {summary['overall_ctr']:.2f}%")
     if 'overall_conversion_rate' in summary:
-        print(f"Conversion Rate: {summary['overall_conversion_rate']:.2f}%")
+        lines.append(f"Conversion Rate: {summary['overall_conversion_rate']:.2f}%")
 
     # Display additional information
-    print(f"\n📋 Analysis Details:")
-    print(f"Channels Analyzed: {summary['channels_analyzed']}")
-    print(f"Metrics Tracked: {', '.join(sorted(summary['metrics_found']))}")
+    lines.append("\n📋 Analysis Details:")
+    lines.append(f"Channels Analyzed: {summary['channels_analyzed']}")
+    ordered = _sorted_names(frozenset(summary['metrics_found']))
+    lines.append(f"Metrics Tracked: {', '.join(ordered)}")
 
     # Display any additional totals
-    additional_totals = [k for k in summary.keys() if k.startswith('total_') and k not in core_metrics]
+    additional_totals = summary.get('_extras', {})
     if additional_totals:
-        print(f"\n➕ Additional Metrics:")
-        for metric in additional_totals:
-            formatted_name = metric.replace('total_', '').replace('_', ' ').title()
-            print(f"{formatted_name}: {summary[metric]:,}")
+        lines.append("\n➕ Additional Metrics:")
+        for metric, total in additional_totals.items():
+            formatted_name = metric.replace('_', ' ').title()
+            lines.append(f"{formatted_name}: {total:,}")
 
-    print("=" * 50)
+    lines.append("=" * 50)
+    print("\n".join(lines))
 
 
 def demonstrate_functionality():
@@ -209,11 +283,11 @@ def demonstrate_functionality():
 
     # Update existing metrics for google_ads
     print("\n1. Updating existing metrics for 'google_ads':")
-    update_metrics(marketing_data, 'google_ads', {'clicks': 1600, 'conversions': 80})
+    update_metrics(marketing_data, 'google_ads', {'clicks': 1600, 'conversions': 80}, verbose=True)
 
     # Add new metrics to facebook_ads
     print("\n2. Adding new metrics to 'facebook_ads':")
-    update_metrics(marketing_data, 'facebook_ads', {'engagement': 450, 'shares': 120})
+    update_metrics(marketing_data, 'facebook_ads', {'engagement': 450, 'shares': 120}, verbose=True)
 
     # Create a new channel
     print("\n3. Creating new channel 'instagram_ads':")
@@ -222,7 +296,7 @@ def demonstrate_functionality():
         'impressions': 8000,
         'conversions': 15,
         'cost': 600
-    })
+    }, verbose=True)
 
     # Display updated data
     display_marketing_data(marketing_data, "UPDATED MARKETING DATA")
@@ -273,10 +347,19 @@ def advanced_demonstration():
 
     for channel, new_data in updates:
         print(f"\nUpdating {channel}:")
-        update_metrics(advanced_data, channel, new_data)
+        update_metrics(advanced_data, channel, new_data, verbose=True)
 
     display_marketing_data(advanced_data, "DATA AFTER BATCH UPDATES")
 
+    # The same kind of batch applied quietly in a single call
+    print("\n📝 BULK UPDATE IN ONE CALL:")
+    update_metrics_many(advanced_data, [
+        ('email_campaign', {'clicks': 400, 'impressions': 9000, 'conversions': 30}),
+        ('search_ads', {'cost': 5400}),
+    ])
+    print(f"Channels after bulk update: {', '.join(advanced_data)}")
+    print(f"Search ads cost: {advanced_data['search_ads']['cost']:,}")
+
     # Final summary
     final_summary = summarize_metrics(advanced_data)
     display_summary(final_summary)
@@ -310,6 +393,12 @@ def error_handling_demonstration():
     except ValueError as e:
         print(f"✓ Correctly handled error: {e}")
 
+    try:
+        # A bad entry in a batch rejects the whole batch
+        update_metrics_many(test_data, [('test_channel', {'clicks': 150}), ('', {'clicks': 5})])
+    except ValueError as e:
+        print(f"✓ Correctly handled error: {e} (clicks still {test_data['test_channel']['clicks']})")
+
 
 # Main execution
 if __name__ == "__main__":
@@ -1,7 +1,30 @@
 import time
+import math
 import functools
+import reprlib
+from array import array
+from collections import defaultdict
+from operator import mul
 from typing import Any, Callable, Dict, List
 
+# Arguments are shown in timing lines at most this wide; reprlib elides large
+# containers without rendering them in full first
+_MAX_ARG_CHARS = 40
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = _ARG_REPR.maxlong = _ARG_REPR.maxother = _MAX_ARG_CHARS
+
+# Timings are recorded in integer nanoseconds and reported in seconds
+_NS_PER_SECOND = 1_000_000_000
+
+
+def _format_arg(value: Any) -> str:
+    """Return a short display form of a timed function's argument."""
+    if isinstance(value, str):
+        if len(value) <= _MAX_ARG_CHARS:
+            return value
+        return value[:_MAX_ARG_CHARS - 3] + "..."
+    return _ARG_REPR.repr(value)
+
 
 class TimerDecorator:
     """
@@ -9,25 +32,50 @@ class TimerDecorator:
     This helps identify performance bottlenecks in the application.
     """
 
-    def __init__(self, func: Callable = None, *, verbose: bool = True, store_results: bool = True):
+    def __init__(self, *, verbose: bool = True, store_results: bool = True):
         """
         Initialize the TimerDecorator.
 
+        Both settings are fixed for the lifetime of the timer, since wrapped
+        functions capture them when they are decorated.
+
         Args:
-            func (Callable): The function to be decorated (for direct usage)
             verbose (bool): Whether to print timing information immediately
             store_results (bool): Whether to store timing data for later analysis
         """
-        self.verbose = verbose
-        self.store_results = store_results
-        self.timing_data: Dict[str, List[float]] = {}
+        self._verbose = verbose
+        self._store_results = store_results
+        # Elapsed nanoseconds per function, packed as C 64-bit integers
+        self.timing_data: Dict[str, array] = defaultdict(functools.partial(array, 'q'))
+
+    @property
+    def verbose(self) -> bool:
+        """Whether timing information is printed immediately (read-only)."""
+        return self._verbose
+
+    @property
+    def store_results(self) -> bool:
+        """Whether timing data is stored for later analysis (read-only)."""
+        return self._store_results
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Make the instance callable so it can be used as a decorator:
+        @TimerDecorator(verbose=True) or @some_timer.
+
+        Args:
+            func (Callable): The function to be decorated
 
-        if func is not None:
-            self.__call__ = functools.wraps(func)(self._create_wrapper(func))
+        Returns:
+            Callable: The wrapped function
+        """
+        return self._create_wrapper(func)
 
-    def __call__(self, func: Callable = None) -> Callable:
+    @classmethod
+    def decorate(cls, func: Callable) -> Callable:
         """
-        Make the class callable so it can be used as a decorator.
+        Wrap a function with its own default-configured timer, for use as a
+        bare decorator: @TimerDecorator.decorate
 
         Args:
             func (Callable): The function to be decorated
@@ -35,12 +83,7 @@ class TimerDecorator:
         Returns:
             Callable: The wrapped function
         """
-        if func is None:
-            # Called with parameters: @TimerDecorator(verbose=True)
-            return lambda f: TimerDecorator(f, verbose=self.verbose, store_results=self.store_results)
-
-        # Called directly: @TimerDecorator
-        return self._create_wrapper(func)
+        return cls()._create_wrapper(func)
 
     def _create_wrapper(self, func: Callable) -> Callable:
         """
@@ -53,48 +96,53 @@ class TimerDecorator:
             Callable: The wrapped function with timing
         """
 
+        # Resolve everything the hot path needs once, at wrap time, so each
+        # call only touches locals (this is why verbose/store_results are
+        # read-only).
+        perf_counter_ns = time.perf_counter_ns
+        func_name = func.__name__
+        timing_data = self.timing_data
+        store_results = self._store_results
+        print_timing_info = self._print_timing_info if self._verbose else None
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             # Record start time
-            start_time = time.perf_counter()
+            start_ns = perf_counter_ns()
 
             try:
                 # Execute the original function
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
                 # Calculate elapsed time (always executed, even if function fails)
-                end_time = time.perf_counter()
-                elapsed_time = end_time - start_time
+                elapsed_ns = perf_counter_ns() - start_ns
 
                 # Store timing data
-                if self.store_results:
-                    if func.__name__ not in self.timing_data:
-                        self.timing_data[func.__name__] = []
-                    self.timing_data[func.__name__].append(elapsed_time)
+                if store_results:
+                    timing_data[func_name].append(elapsed_ns)
 
                 # Print timing information if verbose mode is enabled
-                if self.verbose:
-                    self._print_timing_info(func.__name__, elapsed_time, args, kwargs)
+                if print_timing_info is not None:
+                    print_timing_info(func_name, elapsed_ns, args, kwargs)
 
         return wrapper
 
-    def _print_timing_info(self, func_name: str, elapsed_time: float, args: tuple, kwargs: dict) -> None:
+    def _print_timing_info(self, func_name: str, elapsed_ns: int, args: tuple, kwargs: dict) -> None:
         """
         Print formatted timing information.
 
         Args:
             func_name (str): Name of the executed function
-            elapsed_time (float): Execution time in seconds
+            elapsed_ns (int): Execution time in nanoseconds
             args (tuple): Function arguments
             kwargs (dict): Function keyword arguments
         """
         # Format arguments for display
-        args_str = ", ".join([str(arg) for arg in args])
-        kwargs_str = ", ".join([f"{k}={v}" for k, v in kwargs.items()])
+        args_str = ", ".join(map(_format_arg, args))
+        kwargs_str = ", ".join([f"{k}={_format_arg(v)}" for k, v in kwargs.items()])
         all_args = ", ".join(filter(None, [args_str, kwargs_str]))
 
-        print(f"⏱️  {func_name}({all_args}) executed in {elapsed_time:.6f} seconds")
+        print(f"⏱️  {func_name}({all_args}) executed in {elapsed_ns / _NS_PER_SECOND:.6f} seconds")
 
     def get_stats(self, func_name: str = None) -> Dict[str, Any]:
         """
@@ -116,11 +164,11 @@ class TimerDecorator:
             return {
                 'function': func_name,
                 'call_count': len(times),
-                'total_time': sum(times),
-                'average_time': sum(times) / len(times),
-                'min_time': min(times),
-                'max_time': max(times),
-                'all_times': times
+                'total_time': sum(times) / _NS_PER_SECOND,
+                'average_time': sum(times) / len(times) / _NS_PER_SECOND,
+                'min_time': min(times) / _NS_PER_SECOND,
+                'max_time': max(times) / _NS_PER_SECOND,
+                'all_times': [t / _NS_PER_SECOND for t in times]
             }
         else:
             # Return stats for all functions
@@ -128,10 +176,10 @@ class TimerDecorator:
             for name, times in self.timing_data.items():
                 all_stats[name] = {
                     'call_count': len(times),
-                    'total_time': sum(times),
-                    'average_time': sum(times) / len(times),
-                    'min_time': min(times),
-                    'max_time': max(times)
+                    'total_time': sum(times) / _NS_PER_SECOND,
+                    'average_time': sum(times) / len(times) / _NS_PER_SECOND,
+                    'min_time': min(times) / _NS_PER_SECOND,
+                    'max_time': max(times) / _NS_PER_SECOND
                 }
             return all_stats
 
@@ -155,42 +203,63 @@ class TimerDecorator:
 performance_timer = TimerDecorator(verbose=True, store_results=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _factorial(n: int) -> int:
+    """
+    Memoized recursive factorial - a call only recurses below n down to the
+    largest value already cached.
+    """
+    if n <= 1:
+        return 1
+    return n * _factorial(n - 1)
+
+
 # Method 1: Using the decorator as a class instance
 @performance_timer
 def factorial_recursive(n: int) -> int:
     """
-    Calculate factorial using recursion - can be slow for large numbers.
+    Calculate factorial using memoized recursion.
+
+    As with fibonacci_recursive, the recursion lives in a cached helper so
+    the timer measures the whole call once instead of every stack frame.
     """
-    if n <= 1:
-        return 1
-    return n * factorial_recursive(n - 1)
+    return _factorial(n)
 
 
 # Method 2: Using the decorator class directly
-@TimerDecorator
+@TimerDecorator.decorate
 def factorial_iterative(n: int) -> int:
     """
-    Calculate factorial using iteration - more efficient than recursion.
+    Calculate factorial without recursion - delegates to the C implementation
+    in math.factorial.
     """
-    result = 1
-    for i in range(1, n + 1):
-        result *= i
-    return result
+    return math.factorial(n)
+
+
+@functools.lru_cache(maxsize=None)
+def _fib(n: int) -> int:
+    """
+    Memoized recursive Fibonacci - each n is computed once, then looked up.
+    """
+    if n <= 1:
+        return n
+    return _fib(n - 1) + _fib(n - 2)
 
 
 # Method 3: Using decorator with parameters
 @TimerDecorator(verbose=True, store_results=True)
 def fibonacci_recursive(n: int) -> int:
     """
-    Calculate Fibonacci number using recursion - very slow for larger numbers.
+    Calculate Fibonacci number using memoized recursion.
+
+    The recursion lives in the cached _fib helper so the timer wraps the
+    whole computation once instead of every sub-call.
     """
-    if n <= 1:
-        return n
-    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
+    return _fib(n)
 
 
 # Method 4: More efficient Fibonacci implementation
-@TimerDecorator
+@TimerDecorator.decorate
 def fibonacci_iterative(n: int) -> int:
     """
     Calculate Fibonacci number using iteration - much faster than recursion.
@@ -205,7 +274,7 @@ def fibonacci_iterative(n: int) -> int:
 
 
 # Method 5: Simulate database query or API call
-@TimerDecorator
+@TimerDecorator.decorate
 def simulated_api_call(duration: float) -> str:
     """
     Simulate a time-consuming API call or database query.
@@ -215,7 +284,7 @@ def simulated_api_call(duration: float) -> str:
 
 
 # Method 6: Matrix multiplication simulation
-@TimerDecorator
+@TimerDecorator.decorate
 def matrix_operations(size: int) -> List[List[int]]:
     """
     Simulate matrix operations with given size.
@@ -223,12 +292,10 @@ def matrix_operations(size: int) -> List[List[int]]:
     # Create sample matrices
     matrix = [[i * j for j in range(size)] for i in range(size)]
 
-    # Simulate some computation
-    result = [[0 for _ in range(size)] for _ in range(size)]
-    for i in range(size):
-        for j in range(size):
-            for k in range(size):
-                result[i][j] += matrix[i][k] * matrix[k][j]
+    # Simulate some computation: each cell is a row-by-column dot product,
+    # with the columns materialized once and the multiply-add done in C
+    columns = list(zip(*matrix))
+    result = [[sum(map(mul, row, col)) for col in columns] for row in matrix]
 
     return result
 
@@ -257,14 +324,13 @@ def demonstrate_timer_decorator():
     print("\n2. FIBONACCI SEQUENCE CALCULATIONS")
     print("-" * 40)
 
-    # Test Fibonacci functions (with smaller numbers due to recursion slowness)
+    # Test Fibonacci functions (memoization keeps the recursive version linear)
     fib_numbers = [5, 10, 15, 20, 25]
 
     for n in fib_numbers:
         print(f"\nCalculating Fibonacci({n}):")
-        if n <= 20:  # Recursive is too slow for larger numbers
-            result_fib_recursive = fibonacci_recursive(n)
-            print(f"Recursive result: {result_fib_recursive}")
+        result_fib_recursive = fibonacci_recursive(n)
+        print(f"Recursive result: {result_fib_recursive}")
 
         result_fib_iterative = fibonacci_iterative(n)
         print(f"Iterative result: {result_fib_iterative}")
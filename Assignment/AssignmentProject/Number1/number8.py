@@ -1,11 +1,49 @@
+import gc
+import logging
+import sys
+import weakref
+from typing import Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Demo output separators, built once
+_BANNER = "=" * 70
+_RULE = "-" * 40
+
+
+def _valid_department(department: str) -> str:
+    """
+    Validate a department name and return it interned.
+
+    Departments repeat across many employees, so each distinct name is
+    stored once and shared.
+
+    Raises:
+        ValueError: If the department is not a non-empty string
+    """
+    if not department or not isinstance(department, str):
+        raise ValueError("Department must be a non-empty string")
+    # str() turns a str subclass into a plain str, which sys.intern requires
+    return sys.intern(str(department))
+
+
 class Employee:
     """
     A class to manage employee records efficiently.
     Demonstrates key OOP concepts: encapsulation, constructors, methods, and static fields.
     """
 
-    # Static field to count the number of employees
-    _employee_count = 0
+    # Fixed attribute layout: no per-instance __dict__ (__weakref__ lets
+    # instances be tracked by the WeakSet below; _repr_cache holds the
+    # formatted repr until a setter changes the employee)
+    __slots__ = ("_employee_id", "_name", "_department", "_repr_cache", "__weakref__")
+
+    # Static field tracking live employees; entries vanish as soon as an
+    # employee is garbage collected, so no __del__ bookkeeping is needed
+    _instances: "weakref.WeakSet[Employee]" = weakref.WeakSet()
+
+    # Static company banner, shared by every employee
+    _COMPANY_INFO = "Welcome to Our Company - Employee Management System v1.0"
 
     def __init__(self, employee_id: int, name: str, department: str):
         """
@@ -15,24 +53,30 @@ class Employee:
             employee_id (int): Unique identifier for the employee
             name (str): Full name of the employee
             department (str): Department where the employee works
+
+        Raises:
+            ValueError: If department is not a non-empty string
         """
         self._employee_id = employee_id
         self._name = name
-        self._department = department
+        self._department = _valid_department(department)
+        self._repr_cache = None
 
-        # Increment the static employee count
-        Employee._employee_count += 1
+        # Register with the static set of live employees
+        Employee._instances.add(self)
 
-        print(f"Employee #{employee_id} created: {name} from {department}")
+        logger.debug("Employee #%s created: %s from %s", employee_id, name, department)
 
-    # Getter and Setter methods for name
-    def get_name(self) -> str:
-        """Getter method for employee name."""
+    # Getter and Setter properties for name
+    @property
+    def name(self) -> str:
+        """Getter for employee name."""
         return self._name
 
-    def set_name(self, new_name: str) -> None:
+    @name.setter
+    def name(self, new_name: str) -> None:
         """
-        Setter method for employee name with validation.
+        Setter for employee name with validation.
 
         Args:
             new_name (str): New name for the employee
@@ -42,30 +86,33 @@ class Employee:
 
         old_name = self._name
         self._name = new_name
-        print(f"Employee #{self._employee_id}: Name updated from '{old_name}' to '{new_name}'")
+        self._repr_cache = None
+        logger.debug("Employee #%s: Name updated from '%s' to '%s'", self._employee_id, old_name, new_name)
 
-    # Getter and Setter methods for department
-    def get_department(self) -> str:
-        """Getter method for employee department."""
+    # Getter and Setter properties for department
+    @property
+    def department(self) -> str:
+        """Getter for employee department."""
         return self._department
 
-    def set_department(self, new_department: str) -> None:
+    @department.setter
+    def department(self, new_department: str) -> None:
         """
-        Setter method for employee department with validation.
+        Setter for employee department with validation.
 
         Args:
             new_department (str): New department for the employee
         """
-        if not new_department or not isinstance(new_department, str):
-            raise ValueError("Department must be a non-empty string")
-
         old_department = self._department
-        self._department = new_department
-        print(f"Employee #{self._employee_id}: Department updated from '{old_department}' to '{new_department}'")
+        self._department = _valid_department(new_department)
+        self._repr_cache = None
+        logger.debug("Employee #%s: Department updated from '%s' to '%s'",
+                     self._employee_id, old_department, new_department)
 
     # Getter for employee_id (read-only property)
-    def get_employee_id(self) -> int:
-        """Getter method for employee ID (read-only)."""
+    @property
+    def employee_id(self) -> int:
+        """Getter for employee ID (read-only)."""
         return self._employee_id
 
     # Additional methods for employee management
@@ -91,29 +138,63 @@ class Employee:
     @classmethod
     def get_employee_count(cls) -> int:
         """
-        Class method to get the total number of employees created.
+        Class method to get the number of employees currently alive.
 
         Returns:
             int: Total employee count
         """
-        return cls._employee_count
+        return len(cls._instances)
 
     @classmethod
     def display_employee_count(cls) -> None:
         """Displays the total number of employees."""
-        print(f"\n👥 Total Employees: {cls._employee_count}")
+        print(f"\n👥 Total Employees: {len(cls._instances)}")
+
+    @classmethod
+    def bulk_create(cls, records: Iterable[Tuple[int, str, str]]) -> List["Employee"]:
+        """
+        Class method to create many employees at once, e.g. from a CSV import.
+
+        Fills the slots directly instead of running __init__ per record and
+        logs a single summary line rather than one line per employee.
+
+        Args:
+            records: (employee_id, name, department) tuples
 
-    # Static method for company information
-    @staticmethod
-    def get_company_info() -> str:
+        Returns:
+            list: The created Employee objects, in record order
+
+        Raises:
+            ValueError: If a record's department is not a non-empty string
+        """
+        new = object.__new__
+        register = cls._instances.add
+        employees = []
+        append = employees.append
+
+        for employee_id, name, department in records:
+            emp = new(cls)
+            emp._employee_id = employee_id
+            emp._name = name
+            emp._department = _valid_department(department)
+            emp._repr_cache = None
+            register(emp)
+            append(emp)
+
+        logger.debug("Bulk created %d employees", len(employees))
+        return employees
+
+    # Class method for company information
+    @classmethod
+    def get_company_info(cls) -> str:
         """
-        Static method that returns company information.
-        This method doesn't depend on any instance or class data.
+        Class method that returns company information.
+        This method doesn't depend on any instance data.
 
         Returns:
             str: Company information
         """
-        return "Welcome to Our Company - Employee Management System v1.0"
+        return cls._COMPANY_INFO
 
     # Special methods for better object representation
     def __str__(self) -> str:
@@ -121,32 +202,25 @@ class Employee:
         return f"Employee({self._employee_id}: {self._name} - {self._department})"
 
     def __repr__(self) -> str:
-        """Official string representation of the Employee object."""
-        return f"Employee(employee_id={self._employee_id}, name='{self._name}', department='{self._department}')"
-
-    # Destructor to demonstrate garbage collection
-    def __del__(self):
-        """
-        Destructor method that is called when the object is about to be destroyed.
-        Decrements the employee count and prints a message.
-        """
-        Employee._employee_count -= 1
-        print(f"🗑️  Employee #{self._employee_id} ({self._name}) is being destroyed. "
-              f"Remaining employees: {Employee._employee_count}")
+        """Official string representation of the Employee object (cached until changed)."""
+        if self._repr_cache is None:
+            self._repr_cache = (f"Employee(employee_id={self._employee_id}, "
+                                f"name='{self._name}', department='{self._department}')")
+        return self._repr_cache
 
 
 def demonstrate_employee_class():
     """
     Demonstrates the functionality of the Employee class.
     """
-    print("=" * 70)
+    print(_BANNER)
     print("EMPLOYEE MANAGEMENT SYSTEM DEMONSTRATION")
-    print("=" * 70)
+    print(_BANNER)
 
     print(f"\n{Employee.get_company_info()}")
 
     print("\n1. CREATING EMPLOYEES")
-    print("-" * 40)
+    print(_RULE)
 
     # Create employee instances
     emp1 = Employee(101, "Alice Johnson", "Engineering")
@@ -157,20 +231,20 @@ def demonstrate_employee_class():
     Employee.display_employee_count()
 
     print("\n2. USING GETTER AND SETTER METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     # Demonstrate getter methods
     print(f"\nEmployee 1 Info:")
-    print(f"  ID: {emp1.get_employee_id()}")
-    print(f"  Name: {emp1.get_name()}")
-    print(f"  Department: {emp1.get_department()}")
+    print(f"  ID: {emp1.employee_id}")
+    print(f"  Name: {emp1.name}")
+    print(f"  Department: {emp1.department}")
 
     # Demonstrate setter methods
-    emp1.set_name("Alice Brown")  # Name change due to marriage
-    emp2.set_department("Sales")  # Department transfer
+    emp1.name = "Alice Brown"  # Name change due to marriage
+    emp2.department = "Sales"  # Department transfer
 
     print("\n3. EMPLOYEE INFORMATION DISPLAY")
-    print("-" * 40)
+    print(_RULE)
 
     # Display all employee information
     emp1.display_employee_info()
@@ -178,7 +252,7 @@ def demonstrate_employee_class():
     emp3.display_employee_info()
 
     print("\n4. USING SPECIAL METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     # Demonstrate __str__ and __repr__
     print(f"String representation: {emp1}")
@@ -188,7 +262,7 @@ def demonstrate_employee_class():
     print(f"\nComplete info for emp2: {emp2.get_employee_info()}")
 
     print("\n5. GARBAGE COLLECTION DEMONSTRATION")
-    print("-" * 40)
+    print(_RULE)
 
     # Create temporary employees to demonstrate garbage collection
     print("Creating temporary employees...")
@@ -201,9 +275,8 @@ def demonstrate_employee_class():
     del temp_emp1  # Explicitly delete object
     del temp_emp2  # Explicitly delete object
 
-    # Force garbage collection to see immediate results
-    import gc
-    gc.collect()
+    # No gc.collect() needed: reference counting frees the temporaries as
+    # soon as they are deleted, and the WeakSet drops them immediately
 
     Employee.display_employee_count()
 
@@ -214,35 +287,35 @@ def advanced_employee_operations():
     """
     Demonstrates advanced operations and error handling.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("ADVANCED OPERATIONS AND ERROR HANDLING")
-    print("=" * 70)
+    print(_BANNER)
 
     # Create a new employee for advanced demonstration
     emp = Employee(301, "David Wilson", "Operations")
 
     print("\n1. ERROR HANDLING IN SETTER METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     try:
-        emp.set_name("")  # This should raise ValueError
+        emp.name = ""  # This should raise ValueError
     except ValueError as e:
         print(f"✓ Correctly caught error: {e}")
 
     try:
-        emp.set_department(123)  # This should raise ValueError
+        emp.department = 123  # This should raise ValueError
     except ValueError as e:
         print(f"✓ Correctly caught error: {e}")
 
     print("\n2. MULTIPLE UPDATES")
-    print("-" * 40)
+    print(_RULE)
 
     # Demonstrate multiple updates
-    emp.set_name("David Wilson Jr.")
-    emp.set_department("Senior Operations")
+    emp.name = "David Wilson Jr."
+    emp.department = "Senior Operations"
 
     print("\n3. FINAL STATE")
-    print("-" * 40)
+    print(_RULE)
     emp.display_employee_info()
 
     return emp
@@ -254,9 +327,9 @@ def explain_garbage_collection():
     Provides a detailed explanation of how Python's garbage collection
     manages instances of the Employee class.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("PYTHON GARBAGE COLLECTION EXPLANATION")
-    print("=" * 70)
+    print(_BANNER)
 
     explanation = """
     How Python's Garbage Collection Manages Employee Class Instances:
@@ -270,12 +343,12 @@ def explain_garbage_collection():
          - del emp                            # ref count = 1
          - del emp2                           # ref count = 0 → Object destroyed
 
-    2. DESTRUCTOR EXECUTION (__del__ method):
-       • When an Employee object's reference count reaches 0, __del__ is called
-       • Our __del__ method:
-         - Decrements the static _employee_count
-         - Prints destruction message
-         - Helps track object lifecycle
+    2. WEAK REFERENCES (instance tracking):
+       • Every Employee is added to the static _instances WeakSet
+       • A weak reference does not keep the object alive:
+         - When an Employee's reference count reaches 0, it is destroyed as usual
+         - Its entry disappears from _instances automatically
+       • No __del__ finalizer is needed, so cleanup stays cheap
 
     3. GARBAGE COLLECTOR (GC) for Circular References:
        • Python's GC detects and collects circular references
@@ -294,8 +367,8 @@ def explain_garbage_collection():
        • Useful for immediate cleanup in performance-critical applications
 
     Key Points for Employee Class:
-    • Static _employee_count provides real-time tracking of active objects
-    • __del__ method ensures proper cleanup when objects are destroyed
+    • Static _instances WeakSet provides real-time tracking of active objects
+    • Weak references let objects be cleaned up without a finalizer
     • Getter/setter methods don't affect garbage collection
     • Objects are automatically cleaned up when they go out of scope
     """
@@ -304,18 +377,34 @@ def explain_garbage_collection():
 
 
 if __name__ == "__main__":
+    # Show the per-employee lifecycle messages alongside the demo output
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
+
     # Run the main demonstration
     employees = demonstrate_employee_class()
 
     # Run advanced operations
     advanced_emp = advanced_employee_operations()
 
+    # Import a batch of employees in one call, as from a CSV file
+    print("\n" + _BANNER)
+    print("BULK IMPORT")
+    print(_BANNER)
+    imported = Employee.bulk_create([
+        (401, "Eve Adams", "Engineering"),
+        (402, "Frank Moore", "Engineering"),
+        (403, "Grace Lee", "Marketing"),
+    ])
+    for emp in imported:
+        print(f"  {emp}")
+    Employee.display_employee_count()
+
     # Explain garbage collection
     explain_garbage_collection()
 
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("DEMONSTRATION COMPLETE")
-    print("=" * 70)
+    print(_BANNER)
 
     # Final employee count
     Employee.display_employee_count()
@@ -324,10 +413,9 @@ if __name__ == "__main__":
     # Explicitly delete remaining objects to demonstrate garbage collection
     for emp in employees:
         del emp
+    del imported
 
     # Force final garbage collection
-    import gc
-
     gc.collect()
 
     print(f"Final employee count: {Employee.get_employee_count()}")
\ No newline at end of file
@@ -1,9 +1,62 @@
+import logging
+import re
+import sys
+from array import array
+from operator import index as _as_int
+
+logger = logging.getLogger(__name__)
+
+# Validation rules, compiled once at import
+_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,32}")
+_MAX_NAME_LENGTH = 128
+
+# Quantity-change message, bound once so logging it is a single call
+_QTY_FMT = "📦 Quantity updated: {} → {} ({}{})".format
+
+# Demo output separators, built once
+_BANNER = "=" * 70
+_RULE = "-" * 40
+
+# Largest quantity an InventoryTable row can hold (its array('q') column
+# stores C 64-bit signed integers)
+_TABLE_MAX_QUANTITY = 2 ** 63 - 1
+
+# Stock levels returned by InventoryItem.stock_status()
+OUT_OF_STOCK = 0
+LOW_STOCK = 1
+IN_STOCK = 2
+
+# Display text for each stock level, indexed by stock_status()
+_STOCK_LABELS = ("Out of stock", "Low stock", "In stock")
+
+
+def _to_int(value, message: str) -> int:
+    """Return an integer-like value as an int, or raise ValueError(message)."""
+    try:
+        return _as_int(value)
+    except TypeError:
+        raise ValueError(message) from None
+
+
+def _log_quantity_change(old_quantity: int, new_quantity: int) -> None:
+    """Log a quantity change with its direction and size."""
+    change = new_quantity - old_quantity
+    change_symbol = "↑" if change > 0 else "↓" if change < 0 else "="
+    logger.debug(_QTY_FMT(old_quantity, new_quantity, change_symbol, abs(change)))
+
+
 class InventoryItem:
     """
     A class to manage inventory items with encapsulated attributes and validation.
     This ensures data integrity and prevents unintended modifications.
     """
 
+    # Fixed attribute layout: no per-instance __dict__. The leading
+    # underscore marks the fields as internal; the properties below are the
+    # public interface (_repr_cache holds the formatted repr until a setter
+    # changes the item)
+    __slots__ = ("_item_id", "_name", "_quantity", "_repr_cache")
+
     def __init__(self, item_id: str, name: str, quantity: int = 0):
         """
         Constructor to initialize inventory item with private attributes.
@@ -13,47 +66,31 @@ class InventoryItem:
             name (str): Name of the item
             quantity (int): Initial quantity (default 0, must be non-negative)
         """
-        self.__item_id = None
-        self.__name = None
-        self.__quantity = None
+        self._item_id = None
+        self._name = None
+        self._quantity = None
+        self._repr_cache = None
 
         # Use setters to leverage validation during initialization
-        self.set_item_id(item_id)
-        self.set_name(name)
-        self.set_quantity(quantity)
+        self.item_id = item_id
+        self.name = name
+        self.quantity = quantity
 
-        print(f"✅ Inventory item created: {self.__name} (ID: {self.__item_id})")
+        logger.debug("✅ Inventory item created: %s (ID: %s)", self._name, self._item_id)
 
-    # Getter methods
-    def get_item_id(self) -> str:
+    # Properties: getters plus setters with validation
+    @property
+    def item_id(self) -> str:
         """
         Get the item ID.
 
         Returns:
             str: The item ID
         """
-        return self.__item_id
-
-    def get_name(self) -> str:
-        """
-        Get the item name.
-
-        Returns:
-            str: The item name
-        """
-        return self.__name
-
-    def get_quantity(self) -> int:
-        """
-        Get the current quantity.
-
-        Returns:
-            int: The current quantity
-        """
-        return self.__quantity
+        return self._item_id
 
-    # Setter methods with validation
-    def set_item_id(self, new_id: str) -> None:
+    @item_id.setter
+    def item_id(self, new_id: str) -> None:
         """
         Set a new item ID with validation.
 
@@ -61,18 +98,30 @@ class InventoryItem:
             new_id (str): New item ID
 
         Raises:
-            ValueError: If item ID is empty or not a string
+            ValueError: If item ID is not a string of 1-32 letters, digits, '_' or '-'
         """
-        if not new_id or not isinstance(new_id, str):
-            raise ValueError("Item ID must be a non-empty string")
+        if not isinstance(new_id, str) or not _ID_RE.fullmatch(new_id):
+            raise ValueError("Item ID must be 1-32 letters, digits, '_' or '-'")
 
-        old_id = self.__item_id
-        self.__item_id = new_id
+        old_id = self._item_id
+        self._item_id = new_id
+        self._repr_cache = None
 
         if old_id:
-            print(f"🆔 Item ID updated: '{old_id}' → '{new_id}'")
+            logger.debug("🆔 Item ID updated: '%s' → '%s'", old_id, new_id)
 
-    def set_name(self, new_name: str) -> None:
+    @property
+    def name(self) -> str:
+        """
+        Get the item name.
+
+        Returns:
+            str: The item name
+        """
+        return self._name
+
+    @name.setter
+    def name(self, new_name: str) -> None:
         """
         Set a new item name with validation.
 
@@ -80,18 +129,30 @@ class InventoryItem:
             new_name (str): New item name
 
         Raises:
-            ValueError: If name is empty or not a string
+            ValueError: If name is empty, too long, or not a string
         """
-        if not new_name or not isinstance(new_name, str):
-            raise ValueError("Item name must be a non-empty string")
+        if not (isinstance(new_name, str) and new_name and len(new_name) <= _MAX_NAME_LENGTH):
+            raise ValueError(f"Item name must be a non-empty string of at most {_MAX_NAME_LENGTH} characters")
 
-        old_name = self.__name
-        self.__name = new_name
+        old_name = self._name
+        self._name = new_name
+        self._repr_cache = None
 
         if old_name:
-            print(f"📝 Item name updated: '{old_name}' → '{new_name}'")
+            logger.debug("📝 Item name updated: '%s' → '%s'", old_name, new_name)
+
+    @property
+    def quantity(self) -> int:
+        """
+        Get the current quantity.
+
+        Returns:
+            int: The current quantity
+        """
+        return self._quantity
 
-    def set_quantity(self, new_quantity: int) -> None:
+    @quantity.setter
+    def quantity(self, new_quantity: int) -> None:
         """
         Set a new quantity with validation to prevent negative values.
 
@@ -101,19 +162,17 @@ class InventoryItem:
         Raises:
             ValueError: If quantity is negative or not an integer
         """
-        if not isinstance(new_quantity, int):
-            raise ValueError("Quantity must be an integer")
+        new_quantity = _to_int(new_quantity, "Quantity must be an integer")
 
         if new_quantity < 0:
             raise ValueError(f"❌ Quantity cannot be negative. Attempted: {new_quantity}")
 
-        old_quantity = self.__quantity
-        self.__quantity = new_quantity
+        old_quantity = self._quantity
+        self._quantity = new_quantity
+        self._repr_cache = None
 
-        if old_quantity is not None:
-            change = new_quantity - old_quantity
-            change_symbol = "↑" if change > 0 else "↓" if change < 0 else "="
-            print(f"📦 Quantity updated: {old_quantity} → {new_quantity} ({change_symbol}{abs(change)})")
+        if old_quantity is not None and logger.isEnabledFor(logging.DEBUG):
+            _log_quantity_change(old_quantity, new_quantity)
 
     # Business logic methods
     def increase_quantity(self, amount: int) -> None:
@@ -126,11 +185,18 @@ class InventoryItem:
         Raises:
             ValueError: If amount is not positive
         """
-        if not isinstance(amount, int) or amount <= 0:
+        amount = _to_int(amount, "Increase amount must be a positive integer")
+        if amount <= 0:
             raise ValueError("Increase amount must be a positive integer")
 
-        new_quantity = self.__quantity + amount
-        self.set_quantity(new_quantity)
+        # amount is already validated, so update the slot directly rather
+        # than re-running the setter's checks
+        old_quantity = self._quantity
+        self._quantity = old_quantity + amount
+        self._repr_cache = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_quantity_change(old_quantity, self._quantity)
 
     def decrease_quantity(self, amount: int) -> None:
         """
@@ -142,14 +208,43 @@ class InventoryItem:
         Raises:
             ValueError: If amount is not positive or would result in negative quantity
         """
-        if not isinstance(amount, int) or amount <= 0:
+        amount = _to_int(amount, "Decrease amount must be a positive integer")
+        if amount <= 0:
             raise ValueError("Decrease amount must be a positive integer")
 
-        if self.__quantity - amount < 0:
-            raise ValueError(f"Cannot decrease by {amount}. Current quantity: {self.__quantity}")
+        if self._quantity - amount < 0:
+            raise ValueError(f"Cannot decrease by {amount}. Current quantity: {self._quantity}")
+
+        # Both checks passed, so update the slot directly (see increase_quantity)
+        old_quantity = self._quantity
+        self._quantity = old_quantity - amount
+        self._repr_cache = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_quantity_change(old_quantity, self._quantity)
+
+    def apply_quantity_changes(self, deltas) -> None:
+        """
+        Apply a sequence of signed quantity changes in one step.
+
+        The running total is kept in a local and validated after every change,
+        then stored once, so a long stream of increases and decreases costs a
+        single setter call. If any change is invalid the quantity is left as it was.
+
+        Args:
+            deltas (iterable of int): Changes to apply in order (positive adds, negative removes)
+
+        Raises:
+            ValueError: If a change is not an integer or would make the quantity negative
+        """
+        quantity = self._quantity
+        for delta in deltas:
+            delta = _to_int(delta, "Quantity changes must be integers")
+            quantity += delta
+            if quantity < 0:
+                raise ValueError(f"Cannot apply change {delta}. Quantity would become {quantity}")
 
-        new_quantity = self.__quantity - amount
-        self.set_quantity(new_quantity)
+        self.quantity = quantity
 
     def restock(self, amount: int) -> None:
         """
@@ -158,7 +253,7 @@ class InventoryItem:
         Args:
             amount (int): Amount to restock
         """
-        print(f"🚚 Restocking {self.__name} with {amount} units...")
+        logger.debug("🚚 Restocking %s with %s units...", self._name, amount)
         self.increase_quantity(amount)
 
     def sell(self, amount: int) -> None:
@@ -168,7 +263,7 @@ class InventoryItem:
         Args:
             amount (int): Amount to sell
         """
-        print(f"💰 Selling {amount} units of {self.__name}...")
+        logger.debug("💰 Selling %s units of %s...", amount, self._name)
         self.decrease_quantity(amount)
 
     # Utility methods
@@ -179,14 +274,24 @@ class InventoryItem:
         Returns:
             str: Formatted item information
         """
-        return f"ID: {self.__item_id} | Name: {self.__name} | Quantity: {self.__quantity}"
+        return f"ID: {self._item_id} | Name: {self._name} | Quantity: {self._quantity}"
+
+    def format_info(self) -> str:
+        """
+        Get the multi-line details block shown by display_info.
+
+        Returns:
+            str: Formatted item details
+        """
+        return (f"\n📋 Inventory Item Details:\n"
+                f"   ID: {self._item_id}\n"
+                f"   Name: {self._name}\n"
+                f"   Quantity: {self._quantity}\n"
+                f"   Status: {_STOCK_LABELS[self.stock_status()]}")
 
     def display_info(self) -> None:
         """Display item information in a formatted way."""
-        print(f"\n📋 Inventory Item Details:")
-        print(f"   ID: {self.__item_id}")
-        print(f"   Name: {self.__name}")
-        print(f"   Quantity: {self.__quantity}")
+        print(self.format_info())
 
     def is_out_of_stock(self) -> bool:
         """
@@ -195,7 +300,7 @@ class InventoryItem:
         Returns:
             bool: True if quantity is 0, False otherwise
         """
-        return self.__quantity == 0
+        return self._quantity == 0
 
     def is_low_stock(self, threshold: int = 10) -> bool:
         """
@@ -207,16 +312,177 @@ class InventoryItem:
         Returns:
             bool: True if quantity is below threshold, False otherwise
         """
-        return self.__quantity < threshold
+        return self._quantity < threshold
+
+    def stock_status(self, low_threshold: int = 10) -> int:
+        """
+        Classify the stock level with a single quantity lookup.
+
+        Args:
+            low_threshold (int): Low stock threshold (default 10)
+
+        Returns:
+            int: OUT_OF_STOCK, LOW_STOCK or IN_STOCK
+        """
+        quantity = self._quantity
+        if quantity == 0:
+            return OUT_OF_STOCK
+        return LOW_STOCK if quantity < low_threshold else IN_STOCK
 
     # Special methods
     def __str__(self) -> str:
         """String representation of the inventory item."""
-        return f"InventoryItem('{self.__name}', ID: {self.__item_id}, Qty: {self.__quantity})"
+        return f"InventoryItem('{self._name}', ID: {self._item_id}, Qty: {self._quantity})"
 
     def __repr__(self) -> str:
-        """Official string representation."""
-        return f"InventoryItem(item_id='{self.__item_id}', name='{self.__name}', quantity={self.__quantity})"
+        """Official string representation (cached until the item changes)."""
+        if self._repr_cache is None:
+            self._repr_cache = (f"InventoryItem(item_id='{self._item_id}', "
+                                f"name='{self._name}', quantity={self._quantity})")
+        return self._repr_cache
+
+
+class InventoryTable:
+    """
+    Column-oriented storage for large inventories.
+
+    IDs and names live in parallel lists and quantities in a packed
+    array('q'), so stock scans and bulk sales walk one contiguous buffer
+    instead of touching an InventoryItem object per SKU. Rows are
+    addressed by index, in insertion order.
+    """
+
+    __slots__ = ("_ids", "_names", "_quantities")
+
+    def __init__(self):
+        """Create an empty table."""
+        self._ids = []
+        self._names = []
+        self._quantities = array('q')
+
+    @classmethod
+    def from_items(cls, items) -> "InventoryTable":
+        """
+        Build a table from existing InventoryItem objects.
+
+        Args:
+            items (iterable of InventoryItem): Items to copy, in order
+
+        Returns:
+            InventoryTable: A table with one row per item
+
+        Raises:
+            ValueError: If an item's quantity is too large for the table
+        """
+        table = cls()
+        for item in items:
+            table.add_item(item.item_id, item.name, item.quantity)
+        return table
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def row(self, index: int) -> tuple:
+        """Return (item_id, name, quantity) for a row."""
+        return self._ids[index], self._names[index], self._quantities[index]
+
+    def add_item(self, item_id: str, name: str, quantity: int = 0) -> int:
+        """
+        Append a row, applying the same rules as InventoryItem.
+
+        Returns:
+            int: The new row's index
+
+        Raises:
+            ValueError: If any field fails validation
+        """
+        if not isinstance(item_id, str) or not _ID_RE.fullmatch(item_id):
+            raise ValueError("Item ID must be 1-32 letters, digits, '_' or '-'")
+        if not (isinstance(name, str) and name and len(name) <= _MAX_NAME_LENGTH):
+            raise ValueError(f"Item name must be a non-empty string of at most {_MAX_NAME_LENGTH} characters")
+        quantity = _to_int(quantity, "Quantity must be an integer")
+        if quantity < 0:
+            raise ValueError(f"❌ Quantity cannot be negative. Attempted: {quantity}")
+        if quantity > _TABLE_MAX_QUANTITY:
+            raise ValueError(f"Quantity too large for the table. Attempted: {quantity}")
+
+        self._ids.append(item_id)
+        self._names.append(name)
+        self._quantities.append(quantity)
+        return len(self._ids) - 1
+
+    def low_stock_indices(self, threshold: int = 10) -> list:
+        """
+        Find every row whose quantity is below the threshold.
+
+        Args:
+            threshold (int): Low stock threshold (default 10)
+
+        Returns:
+            list: Row indices, in table order
+        """
+        return [i for i, quantity in enumerate(self._quantities) if quantity < threshold]
+
+    def bulk_sell(self, indices, amounts) -> None:
+        """
+        Sell from many rows at once.
+
+        All sales are checked before any is applied (a row may appear more
+        than once, under a negative index too), so on error the table is
+        left unchanged.
+
+        Args:
+            indices (iterable of int): Row indices to sell from
+            amounts (iterable of int): Positive amounts, paired with indices
+
+        Raises:
+            IndexError: If a row index is out of range
+            ValueError: If indices and amounts differ in length, or an amount
+                        is not positive or exceeds the remaining stock
+        """
+        quantities = self._quantities
+        # Indexing a range normalizes negative indices and bounds-checks them
+        rows = range(len(quantities))
+        pending = {}
+        for index, amount in zip(indices, amounts, strict=True):
+            index = rows[index]
+            amount = _to_int(amount, "Decrease amount must be a positive integer")
+            if amount <= 0:
+                raise ValueError("Decrease amount must be a positive integer")
+            current = pending.get(index, quantities[index])
+            if current < amount:
+                raise ValueError(f"Cannot decrease {self._ids[index]} by {amount}. Current quantity: {current}")
+            pending[index] = current - amount
+
+        for index, quantity in pending.items():
+            quantities[index] = quantity
+
+
+# Edge cases that must raise: constructor cases take no arguments, item
+# cases receive the item under test
+_EDGE_CASES = (
+    ("Empty name", lambda: InventoryItem("ITM004", "", 10)),
+    ("None quantity", lambda: InventoryItem("ITM005", "Test Item", None)),
+    ("Negative initial quantity", lambda: InventoryItem("ITM006", "Test Item", -1)),
+    ("Empty ID", lambda: InventoryItem("", "Test Item", 10)),
+)
+
+_ITEM_EDGE_CASES = (
+    ("Sell more than available", lambda item: item.sell(1000)),
+    ("Decrease with negative amount", lambda item: item.decrease_quantity(-5)),
+    ("Increase with zero amount", lambda item: item.increase_quantity(0)),
+    ("Batched changes that go negative", lambda item: item.apply_quantity_changes([5, -1000])),
+)
+
+
+def _run_edge_case(test_name, test_func, *args):
+    """Run one edge case and report whether it was rejected as expected."""
+    try:
+        print(f"\nTesting: {test_name}")
+        test_func(*args)
+        print(f"❌ UNEXPECTED: {test_name} should have failed!")
+    except (ValueError, TypeError) as e:
+        print(f"✅ Correctly handled: {e}")
 
 
 def test_inventory_item_class():
@@ -224,12 +490,12 @@ def test_inventory_item_class():
     Comprehensive test script for the InventoryItem class.
     Tests normal operations, edge cases, and error handling.
     """
-    print("=" * 70)
+    print(_BANNER)
     print("INVENTORY MANAGEMENT SYSTEM TESTING")
-    print("=" * 70)
+    print(_BANNER)
 
     print("\n1. CREATING INVENTORY ITEMS")
-    print("-" * 40)
+    print(_RULE)
 
     # Create inventory items
     try:
@@ -243,39 +509,39 @@ def test_inventory_item_class():
         return
 
     print("\n2. TESTING GETTER METHODS")
-    print("-" * 40)
+    print(_RULE)
 
-    # Test getter methods
-    print(f"Laptop - ID: {laptop.get_item_id()}, Name: {laptop.get_name()}, Quantity: {laptop.get_quantity()}")
-    print(f"Mouse - ID: {mouse.get_item_id()}, Name: {mouse.get_name()}, Quantity: {mouse.get_quantity()}")
-    print(f"Keyboard - ID: {keyboard.get_item_id()}, Name: {keyboard.get_name()}, Quantity: {keyboard.get_quantity()}")
+    # Test getter properties
+    print(f"Laptop - ID: {laptop.item_id}, Name: {laptop.name}, Quantity: {laptop.quantity}")
+    print(f"Mouse - ID: {mouse.item_id}, Name: {mouse.name}, Quantity: {mouse.quantity}")
+    print(f"Keyboard - ID: {keyboard.item_id}, Name: {keyboard.name}, Quantity: {keyboard.quantity}")
 
     print("\n3. TESTING SETTER METHODS - NORMAL OPERATIONS")
-    print("-" * 40)
+    print(_RULE)
 
     # Test normal setter operations
     try:
-        laptop.set_name("Premium Gaming Laptop")
-        mouse.set_quantity(30)
-        keyboard.set_item_id("ITM003-UPD")
+        laptop.name = "Premium Gaming Laptop"
+        mouse.quantity = 30
+        keyboard.item_id = "ITM003-UPD"
 
         print("\n✅ All normal setter operations completed successfully!")
     except Exception as e:
         print(f"❌ Error in setter operations: {e}")
 
     print("\n4. TESTING QUANTITY VALIDATION - NEGATIVE QUANTITY ATTEMPT")
-    print("-" * 40)
+    print(_RULE)
 
     # Test negative quantity validation
     try:
         print("Attempting to set quantity to -5...")
-        laptop.set_quantity(-5)
+        laptop.quantity = -5
         print("❌ ERROR: This should not be reached!")
     except ValueError as e:
         print(f"✅ Correctly prevented negative quantity: {e}")
 
     print("\n5. TESTING BUSINESS LOGIC METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     # Test business logic methods
     try:
@@ -289,34 +555,24 @@ def test_inventory_item_class():
         laptop.increase_quantity(3)
         laptop.decrease_quantity(2)
 
+        print("\nTesting batched quantity changes:")
+        laptop.apply_quantity_changes([4, -3, 1])
+
         print("\n✅ All business logic operations completed successfully!")
     except Exception as e:
         print(f"❌ Error in business logic: {e}")
 
     print("\n6. TESTING EDGE CASES AND ERROR HANDLING")
-    print("-" * 40)
+    print(_RULE)
 
     # Test various edge cases
-    test_cases = [
-        ("Empty name", lambda: InventoryItem("ITM004", "", 10)),
-        ("None quantity", lambda: InventoryItem("ITM005", "Test Item", None)),
-        ("Negative initial quantity", lambda: InventoryItem("ITM006", "Test Item", -1)),
-        ("Empty ID", lambda: InventoryItem("", "Test Item", 10)),
-        ("Sell more than available", lambda: laptop.sell(1000)),
-        ("Decrease with negative amount", lambda: laptop.decrease_quantity(-5)),
-        ("Increase with zero amount", lambda: laptop.increase_quantity(0)),
-    ]
-
-    for test_name, test_func in test_cases:
-        try:
-            print(f"\nTesting: {test_name}")
-            result = test_func()
-            print(f"❌ UNEXPECTED: {test_name} should have failed!")
-        except (ValueError, TypeError) as e:
-            print(f"✅ Correctly handled: {e}")
+    for test_name, test_func in _EDGE_CASES:
+        _run_edge_case(test_name, test_func)
+    for test_name, test_func in _ITEM_EDGE_CASES:
+        _run_edge_case(test_name, test_func, laptop)
 
     print("\n7. TESTING UTILITY METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     # Test utility methods
     laptop.display_info()
@@ -324,21 +580,42 @@ def test_inventory_item_class():
     print(f"Is out of stock: {laptop.is_out_of_stock()}")
     print(f"Is low stock (threshold 20): {laptop.is_low_stock(20)}")
     print(f"Is low stock (threshold 10): {laptop.is_low_stock(10)}")
+    print(f"Stock status (threshold 30): {_STOCK_LABELS[laptop.stock_status(30)]}")
 
     print("\n8. TESTING SPECIAL METHODS")
-    print("-" * 40)
+    print(_RULE)
 
     # Test special methods
     print(f"String representation: {laptop}")
     print(f"Official representation: {repr(laptop)}")
 
-    print("\n9. FINAL STATE OF ALL ITEMS")
-    print("-" * 40)
+    print("\n9. TESTING BULK OPERATIONS (InventoryTable)")
+    print(_RULE)
+
+    # Copy the items into column storage and work on the copy
+    table = InventoryTable.from_items([laptop, mouse, keyboard])
+    table.add_item("ITM004", "USB-C Hub", 5)
+    print(f"Table rows: {len(table)}")
+    low_stock = [table.row(i)[0] for i in table.low_stock_indices(10)]
+    print(f"Low stock rows (threshold 10): {low_stock}")
+
+    try:
+        table.bulk_sell([0, 1, -1], [2, 5, 1])
+        print("✅ Bulk sale applied:")
+        for i in range(len(table)):
+            print(f"   {table.row(i)}")
+    except (ValueError, IndexError) as e:
+        print(f"❌ Error in bulk sale: {e}")
+
+    _run_edge_case("Bulk sale with a missing amount", table.bulk_sell, [0, 1], [1])
+    _run_edge_case("Overselling one row under two indices", table.bulk_sell, [3, -1], [3, 3])
+
+    print("\n10. FINAL STATE OF ALL ITEMS")
+    print(_RULE)
 
     # Display final state of all items
     items = [laptop, mouse, keyboard]
-    for item in items:
-        item.display_info()
+    sys.stdout.write("\n".join(item.format_info() for item in items) + "\n")
 
     return laptop, mouse, keyboard
 
@@ -347,15 +624,15 @@ def demonstrate_encapsulation():
     """
     Demonstrates that private attributes are truly encapsulated.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("ENCAPSULATION DEMONSTRATION")
-    print("=" * 70)
+    print(_BANNER)
 
     # Create a test item
     test_item = InventoryItem("ENCAP001", "Encapsulated Item", 50)
 
     print("\n1. DIRECT ATTRIBUTE ACCESS ATTEMPTS:")
-    print("-" * 40)
+    print(_RULE)
 
     # Attempt to access private attributes directly
     try:
@@ -376,41 +653,44 @@ def demonstrate_encapsulation():
     except AttributeError as e:
         print(f"✅ Correctly prevented direct access: {e}")
 
-    print("\n2. NAME MANGLING ATTEMPT:")
-    print("-" * 40)
+    print("\n2. INTERNAL ATTRIBUTE ACCESS ATTEMPT:")
+    print(_RULE)
 
-    # Show that even with name mangling, we can't easily modify private attributes
+    # The underscore-prefixed fields are internal by convention only
     try:
-        print("Attempting name mangling access...")
-        # This is the actual mangled name, but it's still not recommended to use
-        mangled_name = f"_InventoryItem__quantity"
-        if hasattr(test_item, mangled_name):
-            print("⚠️  Name mangling exists but should not be used in production code!")
+        print("Attempting internal attribute access...")
+        # This is the actual storage slot, but it's still not recommended to use
+        internal_name = "_quantity"
+        if hasattr(test_item, internal_name):
+            print("⚠️  Internal attributes exist but should not be used in production code!")
             # We won't actually modify it to maintain encapsulation principles
     except Exception as e:
         print(f"Access issue: {e}")
 
     print("\n3. PROPER ACCESS THROUGH GETTERS:")
-    print("-" * 40)
+    print(_RULE)
 
     # Show proper access through getters
-    print(f"Proper ID access: {test_item.get_item_id()}")
-    print(f"Proper name access: {test_item.get_name()}")
-    print(f"Proper quantity access: {test_item.get_quantity()}")
+    print(f"Proper ID access: {test_item.item_id}")
+    print(f"Proper name access: {test_item.name}")
+    print(f"Proper quantity access: {test_item.quantity}")
 
     print("\n✅ Encapsulation is properly enforced!")
 
 
 if __name__ == "__main__":
+    # Show the per-item change messages alongside the test output
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s', stream=sys.stdout)
+
     # Run comprehensive tests
     items = test_inventory_item_class()
 
     # Demonstrate encapsulation
     demonstrate_encapsulation()
 
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print("TESTING COMPLETE")
-    print("=" * 70)
+    print(_BANNER)
     print("\nSummary:")
     print(" Private attributes properly encapsulated")
     print(" Getter and setter methods work correctly")